@@ -1,29 +1,29 @@
 from collections import defaultdict, Counter
 from os.path import abspath, dirname, basename
 from os import listdir
-from xml.sax import make_parser
-from xml.sax.handler import ContentHandler
 from hashlib import sha1
 from datetime import datetime
-from subprocess import Popen, PIPE
+from subprocess import PIPE
 import traceback
+import asyncio
 import os
 import os.path
 import re
 
+from apertium.engine import run_process, run_processes, ProcessError, ProcessTimeout
+from apertium.session import Session, SessionPool, get_session
+from apertium.dix import DixIndex, dix_index
+from apertium.cache import ParseCache, get_cache
+from apertium.checksum import ChecksumService, checksum, checksum_many
+from apertium.vcs import RevisionError, get_revision, set_revision
+from apertium.tools import ToolRegistry, get_tools, require, tool_version
+
 pjoin = os.path.join
 
 
 def whereis(programs):
-	out = {}
-	for p in programs:
-		for path in os.environ.get('PATH', '').split(':'):
-			if os.path.exists(os.path.join(path, p)) and \
-			   not os.path.isdir(os.path.join(path, p)):
-					out[p] = os.path.join(path, p)
-		if not out.get(p):
-			raise EnvironmentError("Cannot find `%s`. Check $PATH." % p)
-	return out
+	"""Returns {program: path} for programs, from the tool registry."""
+	return require(programs)
 
 def split_ext(fn):
 	return tuple(fn.rsplit('.', 1))
@@ -42,80 +42,114 @@ def is_tnx(ext):
 def is_rlx(ext):
 	return ext == "rlx"
 
+_destxt_table = dict((ord(c), "\\" + c) for c in "][\\/@<>^${}")
+_destxt_table.update((ord(c), " [%s]" % c) for c in "\n\t\r")
+
+class DestxtEncoder(object):
+	"""Incremental destxt. Every character is escaped on its own, so chunks
+	can be encoded independently of each other."""
+	def encode(self, chunk, final=False):
+		return chunk.translate(_destxt_table)
+
+class RetxtDecoder(object):
+	"""Incremental retxt. Holds back the tail of a chunk when it could be the
+	start of an escape sequence that continues in the next chunk."""
+	sequence = re.compile(r"\\([\]\[\\/@<>^${}])| \[([\n\t\r])\]")
+	partial = (" ", " [", " [\n", " [\t", " [\r")
+
+	def __init__(self):
+		self.pending = ""
+
+	def decode(self, chunk, final=False):
+		data = self.pending + chunk
+		self.pending = ""
+		if not final:
+			cut = self._safe_end(data)
+			data, self.pending = data[:cut], data[cut:]
+		return self.sequence.sub(r"\1\2", data)
+
+	def _safe_end(self, data):
+		end = len(data)
+		i = end
+		while i > 0 and data[i-1] == "\\":
+			i -= 1
+		if (end - i) % 2:
+			return end - 1
+		for k in (3, 2, 1):
+			if end >= k and data[-k:] in self.partial:
+				return end - k
+		return end
+
 def destxt(data):
-	escape = re.compile(r"[\]\[\\/@<>^${}]")
-	encap = re.compile(r"[\n\t\r]")
-	output = escape.sub(lambda o: re.escape(o.group(0)), data)
-	output = encap.sub(lambda o: " [%s]" % o.group(0), output)
-	return output
+	return data.translate(_destxt_table)
 
 def retxt(data):
-	escape = re.compile(r"\\([\]\[\\/@<>^${}])")
-	encap = re.compile(r" \[([\n\t\r])\]")
-	output = escape.sub(lambda o: o.group(1), data)
-	output = encap.sub(lambda o: o.group(1), output)
-	return output
+	return RetxtDecoder().decode(data, True)
+
+def destxt_stream(chunks):
+	"""Yields destxt'd chunks for an iterable of text chunks."""
+	encoder = DestxtEncoder()
+	for chunk in chunks:
+		yield encoder.encode(chunk)
+
+def retxt_stream(chunks):
+	"""Yields retxt'd chunks for an iterable of text chunks."""
+	decoder = RetxtDecoder()
+	for chunk in chunks:
+		out = decoder.decode(chunk)
+		if out:
+			yield out
+	out = decoder.decode("", True)
+	if out:
+		yield out
+
+def read_chunks(f, size=65536):
+	"""Iterates over a file object in chunks of the given size."""
+	return iter(lambda: f.read(size), f.read(0))
 
 def process(command, data="", shell=False, stdin=PIPE, stdout=PIPE, 
-		stderr=PIPE, close_fds=True):
-	p = Popen(command, shell=shell, stdin=stdin, stdout=stdout, 
-			stderr=stderr, close_fds=close_fds)
+		stderr=PIPE, close_fds=True, timeout=None):
+	"""Runs command with data on stdin and returns (stdout, stderr) decoded.
 	
-	out, err = p.communicate(data)
-	out = out.decode('utf-8')
-	err = err.decode('utf-8')
-
-	if p.returncode != 0:
-		raise Exception("Return code: %s\nstderr: %s" % (p.returncode, err))
+	A synchronous wrapper around apertium.engine.run_process; stderr is
+	always captured.
+	"""
+	out, err = asyncio.run(run_process(command, data, shell=shell, stdin=stdin,
+			stdout=stdout, timeout=timeout, close_fds=close_fds))
+	return out.decode('utf-8'), err.decode('utf-8')
+
+def process_many(jobs, concurrency=None):
+	"""Runs many process calls at once on one event loop.
 	
-	return out, err
+	jobs is an iterable of dicts of apertium.engine.run_process arguments.
+	Returns (stdout, stderr) decoded, or the raised exception, per job.
+	"""
+	results = asyncio.run(run_processes(jobs, concurrency))
+	return [r if isinstance(r, BaseException) else 
+			(r[0].decode('utf-8'), r[1].decode('utf-8')) for r in results]
 
 
 class DixFile(object):
-	class DIXHandler(ContentHandler):
-		def __init__(self):
-			self.lemmas = []
-			self.in_section = False
-
-		def startElement(self, tag, attrs):
-			if tag == "section":
-				self.in_section = True
-			
-			if tag == "e" and self.in_section:
-				self.lemmas.append(attrs.get("lm", None))
-		
-		def endElement(self, tag):
-			if tag == "section":
-				self.in_section = False
-
-	def __init__(self, f):
+	def __init__(self, f, cache=None):
 		self.f = f
-		self.dix = open(f, 'r')
-		self.lemmas = None
-		self.alphabet = None
+		self.cache = cache
+		self.index = None
+	
+	def get_index(self):
+		if self.index is None:
+			self.index = dix_index(self.f, self.cache)
+		return self.index
 	
 	def get_alphabet(self):
-		if not self.alphabet:
-			for line in self.dix:
-				if "<alphabet>" in line:
-					self.alphabet = line.split("<alphabet>")[-1].split("</alphabet>")[0]
-					break
-			self.dix.seek(0)
-		return self.alphabet
+		return self.get_index().alphabet
 	
 	def get_entries(self):
-		if not self.lemmas:
-			parser = make_parser()
-			handler = self.DIXHandler()
-			parser.setContentHandler(handler)
-			try:
-				parser.parse(self.f)
-				self.lemmas = handler.lemmas
-			except Exception as e:
-				print("File %s caused an exception:" % self.f)
-				print(traceback.format_exception_only(type(e), e)[0])
-		return self.lemmas
+		try:
+			return self.get_index().entries
+		except Exception as e:
+			print("File %s caused an exception:" % self.f)
+			print(traceback.format_exception_only(type(e), e)[0])
+			return []
 	
 	def get_unique_entries(self):	
 		return set(self.get_entries())
-
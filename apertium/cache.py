@@ -0,0 +1,135 @@
+"""On-disk cache for summaries parsed out of dictionary and rule files."""
+from hashlib import sha1
+from tempfile import NamedTemporaryFile
+import os
+import os.path
+import pickle
+import zlib
+
+from apertium.checksum import checksum
+
+pjoin = os.path.join
+
+
+def default_cache_dir():
+	"""$AQ_CACHE_DIR, or apertium-quality in the XDG cache directory."""
+	d = os.environ.get('AQ_CACHE_DIR')
+	if d:
+		return d
+	base = os.environ.get('XDG_CACHE_HOME') or pjoin(os.path.expanduser('~'), '.cache')
+	return pjoin(base, 'apertium-quality')
+
+
+class ParseCache(object):
+	"""Cache of parse results keyed by file path, size, mtime and content.
+
+	An entry is used as is while the file's size and mtime are unchanged.
+	If they differ the file is hashed, and the entry is still used (and its
+	stat refreshed) when the content is the same. Entries are pickled and
+	zlib-compressed; when the cache grows past max_size bytes the least
+	recently used entries are removed.
+	"""
+	version = 1
+
+	def __init__(self, directory=None, max_size=256 << 20, enabled=True):
+		self.directory = pjoin(directory or default_cache_dir(), 'parse')
+		self.max_size = max_size
+		self.enabled = enabled
+
+	def _path(self, f, kind):
+		key = "%s\0%s\0%s" % (self.version, kind, os.path.abspath(f))
+		return pjoin(self.directory, sha1(key.encode('utf-8')).hexdigest())
+
+	def _load(self, path):
+		try:
+			with open(path, 'rb') as fp:
+				return pickle.loads(zlib.decompress(fp.read()))
+		except Exception:
+			return None
+
+	def _store(self, path, entry):
+		try:
+			os.makedirs(self.directory, exist_ok=True)
+			tmp = NamedTemporaryFile(dir=self.directory, delete=False)
+			with tmp:
+				tmp.write(zlib.compress(pickle.dumps(entry, pickle.HIGHEST_PROTOCOL)))
+			os.replace(tmp.name, path)
+		except OSError:
+			return # an unwritable cache just means parsing every time
+		self.evict()
+
+	def get(self, f, kind, parse):
+		"""Returns parse(f), taken from the cache when f hasn't changed.
+
+		kind names the sort of summary, so that one file can have several.
+		"""
+		if not self.enabled:
+			return parse(f)
+
+		st = os.stat(f)
+		path = self._path(f, kind)
+		entry = self._load(path)
+		digest = None
+		if entry is not None:
+			size, mtime, old_digest, value = entry
+			if (size, mtime) == (st.st_size, st.st_mtime):
+				try:
+					os.utime(path) # recently used, for evict()
+				except OSError:
+					pass
+				return value
+			digest = checksum(f)
+			if digest == old_digest:
+				self._store(path, (st.st_size, st.st_mtime, digest, value))
+				return value
+
+		digest = digest or checksum(f)
+		value = parse(f)
+		self._store(path, (st.st_size, st.st_mtime, digest, value))
+		return value
+
+	def evict(self):
+		"""Removes least recently used entries until under max_size."""
+		entries = []
+		total = 0
+		for name in os.listdir(self.directory):
+			path = pjoin(self.directory, name)
+			try:
+				st = os.stat(path)
+			except OSError:
+				continue
+			entries.append((st.st_mtime, st.st_size, path))
+			total += st.st_size
+
+		entries.sort()
+		for mtime, size, path in entries:
+			if total <= self.max_size:
+				break
+			try:
+				os.unlink(path)
+				total -= size
+			except OSError:
+				pass
+
+	def clear(self):
+		if not os.path.isdir(self.directory):
+			return
+		for name in os.listdir(self.directory):
+			os.unlink(pjoin(self.directory, name))
+
+
+_default = None
+
+def get_cache(cache=None):
+	"""Returns a ParseCache for cache, which may be a ParseCache, a
+	directory, False to disable caching or None for the default cache."""
+	global _default
+	if isinstance(cache, ParseCache):
+		return cache
+	if cache is False:
+		return ParseCache(enabled=False)
+	if cache is None:
+		if _default is None:
+			_default = ParseCache()
+		return _default
+	return ParseCache(cache)
@@ -0,0 +1,146 @@
+"""Checksums of test inputs, hashed in chunks and memoized.
+
+A file's checksum is remembered for the process, and optionally on disk,
+together with its (size, mtime, inode), so a file that hasn't changed is
+only ever read once.
+"""
+from concurrent.futures import ThreadPoolExecutor
+from threading import Lock
+from hashlib import sha1
+from tempfile import NamedTemporaryFile
+import os
+import os.path
+
+pjoin = os.path.join
+
+
+def file_digest(f, size=1 << 20):
+	"""SHA1 of the file at f, read in chunks."""
+	h = sha1()
+	with open(f, 'rb') as fp:
+		for chunk in iter(lambda: fp.read(size), b''):
+			h.update(chunk)
+	return h.hexdigest()
+
+
+class ChecksumService(object):
+	"""Memoized file checksums (SHA1, the same as Test._checksum).
+
+	directory is where checksums are kept between runs; None disables
+	the on-disk cache. There is one entry per path, replaced when the file
+	changes, and when there are more than max_entries the least recently
+	used are removed.
+	"""
+	def __init__(self, directory=None, max_entries=10000):
+		self.directory = directory
+		self.max_entries = max_entries
+		self.entries = None
+		self.memo = {}
+		self.lock = Lock()
+
+	def _stat(self, path):
+		st = os.stat(path)
+		return "%d %d %d" % (st.st_size, st.st_mtime_ns, st.st_ino)
+
+	def _disk_path(self, path):
+		return pjoin(self.directory, sha1(path.encode('utf-8', 'surrogateescape')).hexdigest())
+
+	def _disk_get(self, path, stat):
+		"""Returns (found, digest); found is whether there was any entry."""
+		f = self._disk_path(path)
+		try:
+			with open(f, 'r') as fp:
+				old, _, digest = fp.read().strip().rpartition(" ")
+		except OSError:
+			return False, None
+		if old != stat or not digest:
+			return True, None
+		try:
+			os.utime(f) # recently used, for evict()
+		except OSError:
+			pass
+		return True, digest
+
+	def _disk_put(self, path, stat, digest, replace):
+		try:
+			os.makedirs(self.directory, exist_ok=True)
+			tmp = NamedTemporaryFile('w', dir=self.directory, delete=False)
+			with tmp:
+				tmp.write("%s %s" % (stat, digest))
+			os.replace(tmp.name, self._disk_path(path))
+		except OSError:
+			return
+		if replace:
+			return
+		with self.lock:
+			if self.entries is None:
+				self.entries = len(os.listdir(self.directory))
+			else:
+				self.entries += 1
+			if self.entries > self.max_entries:
+				self.evict()
+
+	def evict(self):
+		"""Removes least recently used entries until a tenth under
+		max_entries, so that this isn't needed on every new file."""
+		entries = []
+		for name in os.listdir(self.directory):
+			f = pjoin(self.directory, name)
+			try:
+				entries.append((os.stat(f).st_mtime, f))
+			except OSError:
+				continue
+
+		entries.sort()
+		keep = self.max_entries - self.max_entries // 10
+		for mtime, f in entries[:max(len(entries) - keep, 0)]:
+			try:
+				os.unlink(f)
+			except OSError:
+				pass
+		self.entries = min(len(entries), keep)
+
+	def checksum(self, path):
+		"""Returns the checksum of the file at path."""
+		path = os.path.abspath(path)
+		stat = self._stat(path)
+		with self.lock:
+			old, digest = self.memo.get(path, (None, None))
+		if old == stat:
+			return digest
+
+		found, digest = self._disk_get(path, stat) if self.directory else (False, None)
+		if digest is None:
+			digest = file_digest(path)
+			if self.directory:
+				self._disk_put(path, stat, digest, found)
+		with self.lock:
+			self.memo[path] = (stat, digest)
+		return digest
+
+	def checksum_many(self, paths, workers=None):
+		"""Returns the checksums of all paths, in order, hashing files in
+		parallel threads (hashlib releases the GIL while hashing)."""
+		paths = list(paths)
+		if len(paths) < 2:
+			return [self.checksum(p) for p in paths]
+		with ThreadPoolExecutor(workers or min(len(paths), os.cpu_count() or 1)) as pool:
+			return list(pool.map(self.checksum, paths))
+
+
+_default = None
+
+def get_checksums():
+	"""Returns the process-wide ChecksumService, which keeps its on-disk
+	cache next to the parse cache."""
+	global _default
+	if _default is None:
+		from apertium.cache import default_cache_dir
+		_default = ChecksumService(pjoin(default_cache_dir(), 'checksums'))
+	return _default
+
+def checksum(path):
+	return get_checksums().checksum(path)
+
+def checksum_many(paths, workers=None):
+	return get_checksums().checksum_many(paths, workers)
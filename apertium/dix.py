@@ -0,0 +1,85 @@
+"""Single-pass indexer for DIX files."""
+from collections import OrderedDict
+import os
+
+from apertium.cache import get_cache
+
+try:
+	from lxml.etree import iterparse
+except ImportError:
+	from xml.etree.ElementTree import iterparse
+
+
+class DixIndex(object):
+	"""Summary of a DIX file, collected in one streaming pass.
+
+	alphabet is the text of <alphabet>, sdefs the names of the symbol
+	definitions, pardefs maps each paradigm name to its number of entries
+	and entries holds the lm attribute of every entry in the sections
+	(None for entries without one).
+	"""
+	__slots__ = ('alphabet', 'sdefs', 'pardefs', 'entries')
+
+	def __init__(self):
+		self.alphabet = None
+		self.sdefs = []
+		self.pardefs = OrderedDict()
+		self.entries = []
+
+	@classmethod
+	def parse(cls, f):
+		self = cls()
+		stack = []
+		section = False
+		pardef = None
+
+		for event, el in iterparse(f, events=("start", "end")):
+			if event == "start":
+				stack.append(el)
+				if el.tag == "e":
+					if section:
+						self.entries.append(el.get("lm"))
+					elif pardef is not None:
+						self.pardefs[pardef] += 1
+				elif el.tag == "section":
+					section = True
+				elif el.tag == "pardef":
+					pardef = el.get("n")
+					self.pardefs.setdefault(pardef, 0)
+				elif el.tag == "sdef":
+					self.sdefs.append(el.get("n"))
+				continue
+
+			stack.pop()
+			if el.tag == "alphabet":
+				self.alphabet = el.text or ""
+			elif el.tag == "section":
+				section = False
+			elif el.tag == "pardef":
+				pardef = None
+
+			# Drop finished elements so memory stays flat however big the
+			# file is; they're always the last child of their parent here.
+			el.clear()
+			if stack and len(stack[-1]) and stack[-1][-1] is el:
+				del stack[-1][-1]
+		return self
+
+	def get_unique_entries(self):
+		return set(self.entries)
+
+
+_indices = {}
+
+def dix_index(f, cache=None):
+	"""Returns the DixIndex for f, shared by every caller until f changes.
+
+	Indices are also kept in the parse cache (see apertium.cache.get_cache)
+	so unchanged files aren't parsed again on the next run.
+	"""
+	st = os.stat(f)
+	key = (os.path.abspath(f), st.st_size, st.st_mtime)
+	index = _indices.get(key)
+	if index is None:
+		index = _indices[key] = get_cache(cache).get(f, 'dix', DixIndex.parse)
+	return index
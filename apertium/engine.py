@@ -0,0 +1,114 @@
+"""Asyncio engine for running tools as subprocesses.
+
+stdin is fed and stdout/stderr are read concurrently in bounded chunks, so
+a tool never blocks on a full pipe, and every call can have a timeout.
+Many calls can share one event loop through run_processes().
+"""
+from subprocess import PIPE
+import asyncio
+
+
+class ProcessError(Exception):
+	"""A tool exited with a non-zero return code."""
+	def __init__(self, returncode, stderr):
+		Exception.__init__(self, "Return code: %s\nstderr: %s" % (returncode, stderr))
+		self.returncode = returncode
+		self.stderr = stderr
+
+class ProcessTimeout(ProcessError):
+	"""A tool ran past its timeout and was killed."""
+	def __init__(self, command, timeout, stderr=""):
+		Exception.__init__(self, "`%s` timed out after %ss\nstderr: %s" % (command, timeout, stderr))
+		self.returncode = None
+		self.stderr = stderr
+
+
+async def run_process(command, data=b"", shell=False, stdin=PIPE, stdout=PIPE,
+		timeout=None, sink=None, check=True, chunk_size=65536, err_limit=65536,
+		close_fds=True):
+	"""Runs command, feeding it data, and returns (stdout, stderr) as bytes.
+
+	If sink is given it is called with each chunk of stdout as it arrives
+	and the returned stdout is empty. Only the last err_limit bytes of
+	stderr are kept. The process is killed if it runs longer than timeout
+	seconds (ProcessTimeout is raised) or the call is cancelled. With check,
+	a non-zero return code raises ProcessError.
+	"""
+	if hasattr(data, 'encode'):
+		data = data.encode('utf-8')
+
+	if shell:
+		proc = await asyncio.create_subprocess_shell(command, stdin=stdin,
+				stdout=stdout, stderr=PIPE, close_fds=close_fds)
+	else:
+		proc = await asyncio.create_subprocess_exec(*command, stdin=stdin,
+				stdout=stdout, stderr=PIPE, close_fds=close_fds)
+
+	out = []
+	err = bytearray()
+
+	async def feed():
+		if stdin is not PIPE:
+			return
+		try:
+			for i in range(0, len(data), chunk_size):
+				proc.stdin.write(data[i:i+chunk_size])
+				await proc.stdin.drain()
+			proc.stdin.close()
+		except (BrokenPipeError, ConnectionResetError):
+			pass # the return code tells the story
+
+	async def read_out():
+		if stdout is not PIPE:
+			return
+		while 1:
+			chunk = await proc.stdout.read(chunk_size)
+			if not chunk:
+				break
+			if sink is None:
+				out.append(chunk)
+			else:
+				sink(chunk)
+
+	async def read_err():
+		while 1:
+			chunk = await proc.stderr.read(chunk_size)
+			if not chunk:
+				break
+			err.extend(chunk)
+			if len(err) > err_limit:
+				del err[:-err_limit]
+
+	try:
+		# Waiting for the exit is part of the timeout too: a tool may close
+		# its output and still never exit.
+		await asyncio.wait_for(asyncio.gather(feed(), read_out(), read_err(),
+				proc.wait()), timeout)
+	except asyncio.TimeoutError:
+		raise ProcessTimeout(command, timeout, err.decode('utf-8', 'replace'))
+	finally:
+		if proc.returncode is None:
+			proc.kill()
+			await proc.wait()
+
+	if check and proc.returncode != 0:
+		raise ProcessError(proc.returncode, err.decode('utf-8', 'replace'))
+	return b"".join(out), bytes(err)
+
+async def run_processes(jobs, concurrency=None):
+	"""Runs many run_process calls on one event loop.
+
+	jobs is an iterable of dicts of run_process arguments. Returns a list
+	with (stdout, stderr) or the raised exception for each job, in order.
+	At most concurrency processes run at once (unlimited if None).
+	"""
+	limit = asyncio.Semaphore(concurrency) if concurrency else None
+
+	async def job(kwargs):
+		if limit is None:
+			return await run_process(**kwargs)
+		async with limit:
+			return await run_process(**kwargs)
+
+	return await asyncio.gather(*[job(kwargs) for kwargs in jobs],
+			return_exceptions=True)
@@ -0,0 +1,219 @@
+"""Pipelines of tools chained in Python instead of through a shell.
+
+Every stage is started with Popen and the data between stages is relayed
+by a thread per pipe, which counts the bytes going through, filters them
+through any transform and hands them to any taps on the way. Each stage
+records its wall time, CPU time (where os.wait4 is available) and bytes in
+and out.
+"""
+from subprocess import Popen, PIPE
+from collections import deque
+from threading import Thread
+import os
+import signal
+import time
+
+from apertium.engine import ProcessError, ProcessTimeout
+
+
+class Stage(object):
+	"""One process in a Pipeline and its measurements."""
+	def __init__(self, command, name=None, tap=None, transform=None):
+		self.command = list(command)
+		self.name = name or os.path.basename(self.command[0])
+		if tap is not None and hasattr(tap, 'write'):
+			tap = tap.write
+		self.tap = tap
+		self.transform = transform
+		self.reset()
+
+	def reset(self):
+		self.proc = None
+		self.returncode = None
+		self.wall = None
+		self.cpu = None
+		self.bytes_in = 0
+		self.bytes_out = 0
+		self.err = deque(maxlen=50)
+		self.error = None
+
+	def stats(self):
+		return {
+			"name": self.name,
+			"wall": self.wall,
+			"cpu": self.cpu,
+			"bytes_in": self.bytes_in,
+			"bytes_out": self.bytes_out
+		}
+
+
+class Pipeline(object):
+	"""A chain of commands, each one's stdout feeding the next one's stdin.
+
+	A tap is a callable (or an object with write()) given every chunk of
+	its stage's output as bytes, which replaces `tee` to a temp file. A
+	transform takes the iterator of its stage's output chunks and yields
+	the chunks to pass on instead, which replaces a filter like `awk`
+	without a process of its own; the tap sees what it yields.
+	"""
+	bufsize = 65536
+
+	def __init__(self, *commands):
+		self.stages = []
+		for command in commands:
+			self.add(command)
+
+	def add(self, command, name=None, tap=None, transform=None):
+		self.stages.append(Stage(command, name, tap, transform))
+		return self
+
+	def _feed(self, stage, data):
+		stdin = stage.proc.stdin
+		try:
+			for chunk in data:
+				if hasattr(chunk, 'encode'):
+					chunk = chunk.encode('utf-8')
+				stage.bytes_in += len(chunk)
+				stdin.write(chunk)
+		except OSError:
+			pass # the stage's return code tells the story
+		finally:
+			try:
+				stdin.close()
+			except OSError:
+				pass
+
+	def _read(self, stage):
+		fd = stage.proc.stdout.fileno()
+		while 1:
+			chunk = os.read(fd, self.bufsize)
+			if not chunk:
+				break
+			stage.bytes_out += len(chunk)
+			yield chunk
+
+	def _relay(self, stage, after=None, sink=None):
+		"""Copies stage's output into the next stage, or to sink for the
+		last one, counting, transforming and tapping it on the way."""
+		chunks = self._read(stage)
+		if stage.transform is not None:
+			chunks = stage.transform(chunks)
+		try:
+			for chunk in chunks:
+				if not chunk:
+					continue
+				if stage.tap is not None:
+					stage.tap(chunk)
+				if after is None:
+					sink(chunk)
+				else:
+					after.bytes_in += len(chunk)
+					after.proc.stdin.write(chunk)
+		except OSError:
+			pass
+		except Exception as e:
+			stage.error = e # raised by run()
+		finally:
+			stage.proc.stdout.close()
+			if after is not None:
+				try:
+					after.proc.stdin.close()
+				except OSError:
+					pass
+
+	def _drain(self, stage):
+		for line in stage.proc.stderr:
+			stage.err.append(line.decode('utf-8', 'replace'))
+
+	def _wait(self, stage, begin):
+		if hasattr(os, 'wait4'):
+			pid, status, usage = os.wait4(stage.proc.pid, 0)
+			stage.proc.returncode = os.waitstatus_to_exitcode(status)
+			stage.cpu = usage.ru_utime + usage.ru_stime
+		else:
+			stage.proc.wait()
+		stage.returncode = stage.proc.returncode
+		stage.wall = time.time() - begin
+
+	def _kill(self):
+		for stage in self.stages:
+			if stage.proc is None or stage.returncode is not None:
+				continue
+			try:
+				if hasattr(os, 'wait4'):
+					# Popen.kill() would reap the process under os.wait4
+					os.kill(stage.proc.pid, signal.SIGKILL)
+				else:
+					stage.proc.kill()
+			except OSError:
+				pass
+
+	def run(self, data=b"", sink=None, timeout=None):
+		"""Runs the pipeline on data and returns the output as a string.
+
+		data may be a string, bytes, a file object opened in binary mode or
+		an iterable of chunks. If sink is given it is called with each chunk
+		of the output as bytes instead, and None is returned. Every stage
+		is killed if the pipeline runs longer than timeout seconds, and
+		ProcessTimeout is raised.
+		"""
+		if not self.stages:
+			raise ValueError("Pipeline has no stages.")
+		if isinstance(data, (str, bytes)):
+			data = [data]
+		elif hasattr(data, 'read'):
+			f = data
+			data = iter(lambda: f.read(self.bufsize), f.read(0))
+
+		out = []
+		threads = []
+		begin = time.time()
+		for stage in self.stages:
+			stage.reset()
+			stage.proc = Popen(stage.command, stdin=PIPE, stdout=PIPE,
+					stderr=PIPE, close_fds=True)
+			threads.append(Thread(target=self._drain, args=(stage,)))
+
+		threads.append(Thread(target=self._feed, args=(self.stages[0], data)))
+		for stage, after in zip(self.stages, self.stages[1:]):
+			threads.append(Thread(target=self._relay, args=(stage, after)))
+		threads.append(Thread(target=self._relay,
+				args=(self.stages[-1], None, sink or out.append)))
+		waiters = [Thread(target=self._wait, args=(stage, begin)) for stage in self.stages]
+
+		for t in threads + waiters:
+			t.daemon = True
+			t.start()
+		deadline = None if timeout is None else begin + timeout
+		timed_out = False
+		for t in threads + waiters:
+			t.join(None if deadline is None else max(deadline - time.time(), 0))
+			if t.is_alive():
+				timed_out = True
+				self._kill()
+				t.join()
+
+		if timed_out:
+			raise ProcessTimeout(" | ".join(stage.name for stage in self.stages), timeout,
+					"".join("".join(stage.err) for stage in self.stages))
+		for stage in self.stages:
+			if stage.error is not None:
+				raise stage.error
+		for stage in self.stages:
+			if stage.returncode != 0:
+				raise ProcessError(stage.returncode, "%s: %s" % (stage.name, "".join(stage.err)))
+
+		if sink is None:
+			return b"".join(out).decode('utf-8')
+
+	def stats(self):
+		"""Measurements of every stage from the last run."""
+		return [stage.stats() for stage in self.stages]
+
+	def report(self):
+		"""The measurements of the last run as a table."""
+		lines = ["%-24s %9s %9s %12s %12s" % ("Stage", "Wall (s)", "CPU (s)", "Bytes in", "Bytes out")]
+		for s in self.stats():
+			lines.append("%-24s %9.3f %9s %12d %12d" % (s["name"], s["wall"] or 0,
+				"-" if s["cpu"] is None else "%.3f" % s["cpu"], s["bytes_in"], s["bytes_out"]))
+		return "\n".join(lines)
@@ -1,10 +1,15 @@
 from collections import defaultdict, OrderedDict
-from datetime import datetime
+from datetime import datetime, timedelta
 from textwrap import dedent
 from io import StringIO
+from tempfile import NamedTemporaryFile
+import gzip
 import re
 import os 
+import csv
 import json
+import sqlite3
+import time
 import urllib.request
 
 try:
@@ -14,6 +19,18 @@ except:
 	import xml.etree.ElementTree as etree
 	from xml.etree.ElementTree import Element, SubElement
 
+try:
+	import fcntl
+except ImportError:
+	fcntl = None
+
+try:
+	import numpy
+except ImportError:
+	numpy = None
+
+from apertium.quality.series import thin
+
 pjoin = os.path.join
 
 
@@ -31,6 +48,180 @@ def from_isoformat(t):
 	"""Converts time from ISO-8601 string to datetime object"""
 	return datetime.strptime(t, "%Y-%m-%dT%H:%M:%S.%f")
 
+def _revision_key(value):
+	"""Sort key for revisions: numeric ones in numeric order, before any
+	others in string order (which is also how SQLite orders them)."""
+	if isinstance(value, int):
+		return (0, value, "")
+	if value is not None and value.isdigit():
+		return (0, int(value), "")
+	return (1, 0, value or "")
+
+def _revision_order(item):
+	return _revision_key(item[0])
+
+def _number(text):
+	"""text as an int or a float, or as it is if it isn't a number."""
+	try:
+		return int(text)
+	except (TypeError, ValueError):
+		pass
+	try:
+		return float(text)
+	except (TypeError, ValueError):
+		return text
+
+def _in_range(value, bounds):
+	lo, hi = bounds
+	return (lo is None or value >= lo) and (hi is None or value <= hi)
+
+def _timestamp(t):
+	return t.isoformat() if isinstance(t, datetime) else t
+
+def _stat(path):
+	try:
+		st = os.stat(path)
+	except OSError:
+		return None
+	return (st.st_ino, st.st_size, st.st_mtime_ns)
+
+def _read_tree(path):
+	"""Parses the XML file at path, which is gzipped if it ends in .gz."""
+	with (gzip.open if path.endswith(".gz") else open)(path, 'rb') as f:
+		return etree.parse(f)
+
+def _write_tree(tree, path):
+	"""Writes tree to path atomically: to a temporary file in the same
+	directory which then replaces path. Gzipped if path ends in .gz."""
+	d = os.path.dirname(os.path.abspath(path))
+	tmp = NamedTemporaryFile(dir=d, prefix=".%s." % os.path.basename(path), delete=False)
+	try:
+		with tmp:
+			if path.endswith(".gz"):
+				# mtime=0 so that unchanged content gives identical files
+				with gzip.GzipFile(fileobj=tmp, mode='wb', mtime=0) as f:
+					tree.write(f, encoding="utf-8", xml_declaration=True)
+			else:
+				tree.write(tmp, encoding="utf-8", xml_declaration=True)
+			tmp.flush()
+			os.fsync(tmp.fileno())
+		try:
+			mode = os.stat(path).st_mode & 0o777
+		except OSError:
+			mode = 0o644
+		os.chmod(tmp.name, mode)
+		os.replace(tmp.name, path)
+	except:
+		os.unlink(tmp.name)
+		raise
+
+def _qualify(node, ns):
+	"""Puts node and all its descendants in namespace ns."""
+	for i in node.iter():
+		if isinstance(i.tag, str) and not i.tag.startswith("{"):
+			i.tag = ns + i.tag
+	return node
+
+
+class FileLock(object):
+	"""Exclusive lock on path + ".lock", held across processes.
+	
+	flock() is used where available. Elsewhere the lock file is created
+	with O_EXCL, waiting up to timeout seconds for another holder. Either
+	way the lock file is removed on release.
+	"""
+	def __init__(self, path, timeout=60):
+		self.path = path + ".lock"
+		self.timeout = timeout
+		self.fd = None
+	
+	def acquire(self):
+		if fcntl is not None:
+			while 1:
+				fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o666)
+				fcntl.flock(fd, fcntl.LOCK_EX)
+				# the last holder may have unlinked the file we locked
+				try:
+					if os.fstat(fd).st_ino == os.stat(self.path).st_ino:
+						self.fd = fd
+						return
+				except FileNotFoundError:
+					pass
+				os.close(fd)
+		
+		give_up = time.time() + self.timeout
+		while 1:
+			try:
+				self.fd = os.open(self.path, os.O_RDWR | os.O_CREAT | os.O_EXCL, 0o666)
+				return
+			except FileExistsError:
+				if time.time() > give_up:
+					raise IOError("Timed out waiting for %s." % self.path)
+				time.sleep(0.05)
+	
+	def release(self):
+		if self.fd is None:
+			return
+		# unlinked while still held, so waiters notice and reopen
+		os.unlink(self.path)
+		os.close(self.fd)
+		self.fd = None
+	
+	def __enter__(self):
+		self.acquire()
+		return self
+	
+	def __exit__(self, *exc):
+		self.release()
+
+
+class Record(object):
+	"""One revision of one result from Statistics.query.
+	
+	Child values are available as record['percent'] or through values().
+	"""
+	__slots__ = ('section', 'tag', 'key', 'revision', 'timestamp', '_element', '_data')
+	
+	def __init__(self, section, tag, key, revision, timestamp, element=None, data=None):
+		self.section = section
+		self.tag = tag
+		self.key = key
+		self.revision = revision
+		self.timestamp = timestamp
+		self._element = element
+		self._data = data
+	
+	@property
+	def element(self):
+		"""The revision element itself, parsed on first use."""
+		if self._element is None:
+			self._element = etree.fromstring(self._data)
+		return self._element
+	
+	def get(self, name, default=None):
+		node = self.element.find(Statistics.ns + name)
+		if node is None:
+			return default
+		return node.text
+	
+	def __getitem__(self, name):
+		node = self.element.find(Statistics.ns + name)
+		if node is None:
+			raise KeyError(name)
+		return node.text
+	
+	def values(self):
+		"""{name: text} for every child of the revision element that has no
+		children of its own."""
+		out = OrderedDict()
+		for node in self.element:
+			if len(node) == 0 and isinstance(node.tag, str):
+				out[node.tag.split("}")[-1]] = node.text
+		return out
+	
+	def __repr__(self):
+		return "<Record %s %s r%s>" % (self.section, self.key, self.revision)
+
 
 class Statistics(object):
 	ns = "{%s}" % schemas['statistics']
@@ -47,88 +238,324 @@ class Statistics(object):
 			"coverage": self.get_coverage,
 			"ambiguity": self.get_ambiguity,
 			"morph": self.get_morph,
-			"vocabulary": lambda x, y: None
+			"vocabulary": lambda root: dict()
 		}
 		
+		self.views = {}
+		self.pending = []
+		self.dirty = set()
 		if f is None:
 			return
 		self.f = f
-		
-		if os.path.exists(f):
-			self.tree = etree.parse(open(f, 'rb'))
+		self.load()
+	
+	def load(self):
+		"""(Re)reads the file, or starts an empty tree if there is none.
+		Files ending in .gz are gzipped."""
+		self.views = {}
+		self.stat = _stat(self.f)
+		if self.stat is not None:
+			self.tree = _read_tree(self.f)
 			if self.tree.getroot().tag == Statistics.ns + "statistics":
 				self.root = self.tree.getroot()
 			else:
 				raise ParseError("File does not seem to be a statistics file.")
 		else:
-			kwargs = {}
-			if etree.__name__ == "lxml.etree":
-				kwargs['nsmap'] = {None: schemas['statistics']}
-			else:
-				kwargs["xmlns"] = schemas['statistics']
-			
-			self.root = Element(Statistics.ns + "statistics", **kwargs)
+			self.root = self.new_root()
 			self.tree = etree.ElementTree(self.root)
+		
+		self.build_index()
+	
+	@staticmethod
+	def new_root():
+		"""Returns an empty statistics element."""
+		kwargs = {}
+		if etree.__name__ == "lxml.etree":
+			kwargs['nsmap'] = {None: schemas['statistics']}
+		else:
+			kwargs["xmlns"] = schemas['statistics']
+		return Element(Statistics.ns + "statistics", **kwargs)
 	
 	def write(self):
-		try: 
-			self.tree.write(self.f, encoding="utf-8", xml_declaration=True)
-		except:
-			f = open(self.f, 'w')
-			f.write("<?xml version='1.0' encoding='utf-8'?>\n")
-			f.write(etree.tostring(self.tree.getroot()))
-			f.close()
+		"""Saves the results added since the file was read.
 		
+		Other processes may write the same file at the same time, so under
+		the file's lock it is read again if it has changed, the pending
+		results are merged into it and it is replaced atomically.
+		"""
+		with FileLock(self.f):
+			if _stat(self.f) != self.stat:
+				self.load()
+				self._replay()
+			
+			_write_tree(self.tree, self.f)
+			self.stat = _stat(self.f)
+			self.pending = []
+			self.dirty = set()
+	
+	def _replay(self):
+		"""Makes the changes since the last write again, on fresh data."""
+		for func, args in self.pending:
+			func(*args)
+	
+	def _refresh(self, tag):
+		"""Reads the file again if another process has written it since,
+		so that get() doesn't return views of old data."""
+		if getattr(self, "f", None) is not None and _stat(self.f) != self.stat:
+			self.load()
+			self._replay()
+	
+	@staticmethod
+	def node_key(node):
+		return (node.tag, tuple(sorted(node.attrib.items())))
+	
+	def build_index(self):
+		"""Indexes second level nodes by (parent, tag, attributes) and their
+		revisions by value, so that add() doesn't scan the history."""
+		self.sections = {}
+		self.nodes = {}
+		self.revisions = {}
+		for section in self.root:
+			parent = section.tag[len(self.ns):]
+			self.sections[parent] = section
+			for node in section:
+				self._index_node(parent, node)
+	
+	def _index_node(self, parent, node):
+		key = (parent,) + self.node_key(node)
+		self.nodes.setdefault(key, node)
+		for rev in node:
+			self.revisions.setdefault(key + (rev.attrib.get("value"),), rev)
+		return key
+	
 	def add(self, parent, xml):
+		"""Adds the result in xml to parent. A revision that is already
+		there is replaced."""
+		self._add(parent, xml)
+		self.pending.append((self._add, (parent, xml)))
+	
+	def _add(self, parent, xml):
 		ns = self.ns
 		if parent not in self.elements:
 			raise AttributeError("Element '%s' not supported." % parent)
 		
 		# Get new node, fix namespace prefix
-		old_node = None
-		new_node = etree.fromstring(xml)
-		if not new_node.tag.startswith(ns):
-			new_node.tag = ns + new_node.tag
+		new_node = _qualify(etree.fromstring(xml), ns)
 		
 		# If parent node doesn't exist, create it
-		parent_node = self.root.find(ns + parent)
+		parent_node = self.get_root(parent)
 		if parent_node is None: 
-			parent_node = SubElement(self.root, ns + parent)
+			parent_node = self._new_section(parent)
+		self.dirty.add(parent)
+		self.views.pop(parent, None)
 		
-		# Try to find an equal node for second level node
-		for i in parent_node.getiterator(new_node.tag):
-			if self.node_equal(new_node, i):
-				old_node = i
-				break
-	
+		key = (parent,) + self.node_key(new_node)
+		old_node = self.nodes.get(key)
 		if old_node is None:
 			parent_node.append(new_node)
+			self._index_node(parent, new_node)
 			return
 		
-		# Try to find an equal node for third level node
-		rev_node = new_node.find("revision")	
-		for i in old_node.getiterator(rev_node.tag):
-			a = i.attrib.get("value")
-			b = rev_node.attrib.get("value")
-			if not None in (a, b) and a == b:
-				i = rev_node # Overwrite old data
-				return
-		
-		# Else append as no override required
-		old_node.append(new_node.find("revision"))
+		for rev in list(new_node):
+			value = rev.attrib.get("value")
+			old_rev = self.revisions.get(key + (value,)) if value is not None else None
+			if old_rev is None:
+				old_node.append(rev)
+				if value is not None:
+					self.revisions[key + (value,)] = rev
+				continue
+			
+			# Overwrite old data in place
+			tail = old_rev.tail
+			old_rev.clear()
+			old_rev.tail = tail
+			old_rev.attrib.update(rev.attrib)
+			old_rev.text = rev.text
+			old_rev.extend(list(rev))
 
+	def _new_section(self, parent):
+		node = self.sections[parent] = SubElement(self.root, self.ns + parent)
+		return node
+	
+	def compact(self, after=timedelta(days=90), resolution=timedelta(days=7), now=None):
+		"""Thins out history older than after, keeping only the latest
+		revision of each result in every period of length resolution.
+		Returns the number of revisions removed; write() saves them."""
+		now = now or datetime.utcnow()
+		removed = self._compact(after, resolution, now)
+		self.pending.append((self._compact, (after, resolution, now)))
+		return removed
+	
+	def _compact(self, after, resolution, now):
+		cutoff = now - after
+		step = resolution.total_seconds()
+		epoch = datetime(1970, 1, 1)
+		removed = 0
+		for section in self.section_names():
+			root = self.get_root(section)
+			if root is None:
+				continue
+			for node in root:
+				key = (section,) + self.node_key(node)
+				buckets = defaultdict(list)
+				for rev in node:
+					try:
+						t = from_isoformat(rev.attrib["timestamp"])
+					except (KeyError, ValueError):
+						continue
+					if t < cutoff:
+						buckets[int((t - epoch).total_seconds() // step)].append(rev)
+				
+				for revs in buckets.values():
+					revs.sort(key=lambda r: _revision_key(r.attrib.get("value")))
+					for rev in revs[:-1]:
+						node.remove(rev)
+						value = rev.attrib.get("value")
+						if self.revisions.get(key + (value,)) is rev:
+							del self.revisions[key + (value,)]
+						removed += 1
+						self.dirty.add(section)
+						self.views.pop(section, None)
+		return removed
+	
+	def query(self, section, key=None, revisions=None, timestamps=None, limit=None, reverse=False):
+		"""Yields a Record for each revision in section, ordered by revision
+		(newest first with reverse), without building the whole history.
+		
+		key only keeps the results of one dictionary, title or config.
+		revisions and timestamps are inclusive (low, high) ranges, where
+		either end may be None. At most limit records are yielded.
+		"""
+		if not section in self.elements:
+			raise AttributeError("Element not supported.")
+		
+		root = self.get_root(section)
+		if root is None or limit == 0:
+			return
+		
+		if revisions is not None:
+			revisions = tuple(None if i is None else _revision_key(str(i)) for i in revisions)
+		if timestamps is not None:
+			timestamps = tuple(_timestamp(i) for i in timestamps)
+		
+		found = []
+		for node in root:
+			value = node.attrib.get("value")
+			if key is not None and value != key:
+				continue
+			for rev in node:
+				r = _revision_key(rev.attrib.get("value"))
+				if revisions is not None and not _in_range(r, revisions):
+					continue
+				if timestamps is not None and not _in_range(rev.attrib.get("timestamp", ""), timestamps):
+					continue
+				found.append((r, value or "", node, rev))
+		
+		found.sort(key=lambda x: x[:2], reverse=reverse)
+		for r, value, node, rev in found[:limit]:
+			yield Record(section, node.tag[len(self.ns):], node.attrib.get("value"),
+					rev.attrib.get("value"), rev.attrib.get("timestamp"), element=rev)
+	
+	def to_columns(self, section, key=None, arrays=True):
+		"""Returns the history of section as columns, per key:
+		{key: {"revision": ..., "timestamp": ..., metric: ...}}, with one
+		column for each numeric value (percent, total, ...), in revision
+		order. Missing or non-numeric values are NaN (None without arrays).
+		
+		With arrays the columns are NumPy arrays: revisions as integers
+		where all are numeric, timestamps as datetime64 and metrics as
+		floats. This needs NumPy; otherwise they are lists.
+		"""
+		if arrays and numpy is None:
+			raise ImportError("NumPy is required for columnar arrays.")
+		
+		rows = defaultdict(list)
+		for record in self.query(section, key=key):
+			rows[record.key].append(record)
+		
+		out = OrderedDict()
+		for k, records in rows.items():
+			metrics = OrderedDict()
+			for n, record in enumerate(records):
+				for name, value in record.values().items():
+					try:
+						value = float(value)
+					except (TypeError, ValueError):
+						continue
+					metrics.setdefault(name, [None] * len(records))[n] = value
+			
+			cols = out[k] = OrderedDict()
+			cols["revision"] = [r.revision for r in records]
+			cols["timestamp"] = [r.timestamp for r in records]
+			cols.update(metrics)
+			if not arrays:
+				continue
+			
+			if all(r is not None and r.isdigit() for r in cols["revision"]):
+				cols["revision"] = numpy.array(cols["revision"], dtype=numpy.int64)
+			else:
+				cols["revision"] = numpy.array(cols["revision"], dtype=object)
+			cols["timestamp"] = numpy.array(cols["timestamp"], dtype="datetime64[us]")
+			for name in metrics:
+				cols[name] = numpy.array([numpy.nan if i is None else i for i in cols[name]], dtype=numpy.float64)
+		return out
+	
+	def to_csv(self, section, f, key=None):
+		"""Writes the history of section to f (a path or a text file) as
+		CSV, one row per key and revision. Doesn't need NumPy."""
+		columns = self.to_columns(section, key=key, arrays=False)
+		header = ["key", "revision", "timestamp"]
+		for cols in columns.values():
+			header.extend(i for i in cols if i not in header)
+		
+		fp = open(f, 'w', newline='') if isinstance(f, str) else f
+		try:
+			writer = csv.writer(fp)
+			writer.writerow(header)
+			for k, cols in columns.items():
+				for n in range(len(cols["revision"])):
+					row = [k]
+					for name in header[1:]:
+						value = cols.get(name, ())
+						value = value[n] if n < len(value) else None
+						row.append("" if value is None else value)
+					writer.writerow(row)
+		finally:
+			if fp is not f:
+				fp.close()
+	
+	def get_root(self, tag):
+		"""Returns the element of section tag, or None if it is empty."""
+		return self.sections.get(tag)
+	
+	def section_names(self):
+		return list(self.sections)
+	
 	def get(self, tag):
+		"""Returns the parsed view of section tag: {key: {revision: {field:
+		value}}}, revisions in order and numeric values as numbers.
+		
+		The view is built once and kept until the section changes, here or
+		in another process, so it is shared between calls and must not be
+		modified.
+		"""
 		if not tag in self.elements:
 			raise AttributeError("Element not supported.")
 		
-		root = self.root.find(self.ns + tag)
-		if root is None:
-			return dict()
-		
-		return self.elements[tag](root)
+		self._refresh(tag)
+		view = self.views.get(tag)
+		if view is None:
+			root = self.get_root(tag)
+			view = self.views[tag] = dict() if root is None else self.elements[tag](root)
+		return view
 
-	def get_raphael(self, tag, data, lines1, lines2, x=None):
-		"""Get output suitable for JSONing for Raphael charts"""
+	def get_raphael(self, tag, data, lines1, lines2, x=None, points=None, method="lttb"):
+		"""Get output suitable for JSONing for Raphael charts
+		
+		With points, a series longer than that is downsampled to points
+		points with method ("lttb" or "minmax", see series.downsample).
+		Without, every point is kept.
+		"""
 		out = {}
 		dat = self.get(tag)
 		
@@ -144,81 +571,84 @@ class Statistics(object):
 					out[key]['data'].append(v[data])
 					out[key]['lines1'].append("%s: %s" % (lines1, v[lines1]))
 					out[key]['lines2'].append("%s: %s" % (lines2, v[lines2]))
+			
+			if points:
+				out[key] = thin(out[key], points, method)
 		
-		return out			
+		return out
 
 	def get_general(self, root):
 		dicts = defaultdict(dict)
 		
-		for d in root.getiterator(self.ns + "dictionary"):
+		for d in root.iter(self.ns + "dictionary"):
 			dct = d.attrib['value']
-			for rev in d.getiterator(self.ns + 'revision'):
+			for rev in d.iter(self.ns + 'revision'):
 				r = rev.attrib['value']
 				
 				dicts[dct][r] = {
 					"Timestamp": rev.attrib['timestamp'],
-					"Entries": rev.find(self.ns + "entries").text,
-					"Unique entries": rev.find(self.ns + "unique-entries").text,
-					"Rules": rev.find(self.ns + "rules").text
+					"Entries": _number(rev.find(self.ns + "entries").text),
+					"Unique entries": _number(rev.find(self.ns + "unique-entries").text),
+					"Rules": _number(rev.find(self.ns + "rules").text)
 				}
 		
 		out = dict()
 		for k, v in dicts.items():
-			out[k] = OrderedDict(sorted(v.items()))
+			out[k] = OrderedDict(sorted(v.items(), key=_revision_order))
 
 		return out
 	
 	def get_generation(self, root):
 		generations = defaultdict(dict)
 		
-		for d in root.getiterator(self.ns + "dictionary"):
+		for d in root.iter(self.ns + "dictionary"):
 			dct = d.attrib["value"]
-			for rev in d.getiterator(self.ns + "revision"):
+			for rev in d.iter(self.ns + "revision"):
 				r = rev.attrib["value"]
-				c = rev.find("corpus")
+				c = rev.find(self.ns + "corpus")
 				
 				generations[dct][r] = {
 					"Timestamp": rev.attrib["timestamp"],
 					"Corpus": "%s__%s" % (c.attrib["value"], c.attrib["checksum"]),
-					"Total": rev.find(self.ns + "total").text,
-					"Multiform": rev.find(self.ns + "multiform").text,
-					"Multibidix": rev.find(self.ns + "multibidix").text,
-					"Tag mismatch": rev.find(self.ns + "tagmismatch").text
+					"Total": _number(rev.find(self.ns + "total").text),
+					"Multiform": _number(rev.find(self.ns + "multiform").text),
+					"Multibidix": _number(rev.find(self.ns + "multibidix").text),
+					"Tag mismatch": _number(rev.find(self.ns + "tagmismatch").text)
 				}
 		
 		out = dict()
 		for k, v in generations.items():
-			out[k] = OrderedDict(sorted(v.items()))
+			out[k] = OrderedDict(sorted(v.items(), key=_revision_order))
 
 		return out
 
 	def get_regression(self, root):
 		regressions = defaultdict(dict)
 		
-		for d in root.getiterator(self.ns + "title"):
+		for d in root.iter(self.ns + "title"):
 			title = d.attrib['value']
-			for rev in d.getiterator(self.ns + 'revision'):
+			for rev in d.iter(self.ns + 'revision'):
 				r = rev.attrib['value']
 				
 				regressions[title][r] = {
 					"Timestamp": rev.attrib['timestamp'],
-					"Percent": rev.find(self.ns + "percent").text,
-					"Total": rev.find(self.ns + "total").text,
-					"Passes": rev.find(self.ns + "passes").text,
-					"Fails": rev.find(self.ns + "fails").text
+					"Percent": _number(rev.find(self.ns + "percent").text),
+					"Total": _number(rev.find(self.ns + "total").text),
+					"Passes": _number(rev.find(self.ns + "passes").text),
+					"Fails": _number(rev.find(self.ns + "fails").text)
 				}
 
 		out = dict()
 		for k, v in regressions.items():
-			out[k] = OrderedDict(sorted(v.items()))
+			out[k] = OrderedDict(sorted(v.items(), key=_revision_order))
 
 		return out
 	
 	def get_coverage(self, root):	
 		coverages = defaultdict(dict)	
-		for d in root.getiterator(self.ns + "dictionary"):
+		for d in root.iter(self.ns + "dictionary"):
 			dct = d.attrib["value"]
-			for rev in d.getiterator(self.ns + "revision"):
+			for rev in d.iter(self.ns + "revision"):
 				
 				r = rev.attrib['value']
 				c = rev.find(self.ns + "corpus")
@@ -227,53 +657,53 @@ class Statistics(object):
 					"Checksum": rev.attrib["checksum"],
 					"Timestamp": rev.attrib['timestamp'],
 					"Corpus": "%s__%s" % (c.attrib["value"], c.attrib["checksum"]),
-					"Percent": rev.find(self.ns + "percent").text,
-					"Total": rev.find(self.ns + "total").text,	
-					"Known": rev.find(self.ns + "known").text,	
-					"Unknown": rev.find(self.ns + "unknown").text,
+					"Percent": _number(rev.find(self.ns + "percent").text),
+					"Total": _number(rev.find(self.ns + "total").text),	
+					"Known": _number(rev.find(self.ns + "known").text),	
+					"Unknown": _number(rev.find(self.ns + "unknown").text),
 					#'':'',
 					#"Top words:": ''#OrderedDict()
 				})
-			#for j in i.find("top").getiterator("word"):
+			#for j in i.find("top").iter("word"):
 			#	coverages[dct][rev][j.text] = j.attrib["count"]
-			##for j in i.find("top").getiterator("word"):
+			##for j in i.find("top").iter("word"):
 			##	coverages[dct][rev]['top'][j.text] = j.attrib["count"]
 
 		out = dict()
 		for k, v in coverages.items():
-			out[k] = OrderedDict(sorted(v.items()))
+			out[k] = OrderedDict(sorted(v.items(), key=_revision_order))
 
 		return out
 
 	def get_ambiguity(self, root):
 		ambiguities = defaultdict(dict)
 		
-		for d in root.getiterator(self.ns + "dictionary"):
+		for d in root.iter(self.ns + "dictionary"):
 			dct = d.attrib["value"]
-			for rev in d.getiterator(self.ns + "revision"):
+			for rev in d.iter(self.ns + "revision"):
 				
 				r = rev.attrib['value']
 
 				ambiguities[dct][r] = {
 					"Checksum": rev.attrib["checksum"],
 					"Timestamp": rev.attrib['timestamp'],
-					"Surface forms": rev.find(self.ns + "surface-forms").text,
-					"Analyses": rev.find(self.ns + "analyses").text,
-					"Average": rev.find(self.ns + "average").text
+					"Surface forms": _number(rev.find(self.ns + "surface-forms").text),
+					"Analyses": _number(rev.find(self.ns + "analyses").text),
+					"Average": _number(rev.find(self.ns + "average").text)
 				}
 
 		out = dict()
 		for k, v in ambiguities.items():
-			out[k] = OrderedDict(sorted(v.items()))
+			out[k] = OrderedDict(sorted(v.items(), key=_revision_order))
 
 		return out	
 
 	def get_morph(self, root):
 		morphs = defaultdict(dict)
 		
-		for d in root.getiterator(self.ns + "config"):
+		for d in root.iter(self.ns + "config"):
 			cfg = d.attrib["value"]
-			for rev in d.getiterator(self.ns + "revision"):
+			for rev in d.iter(self.ns + "revision"):
 				
 				r = rev.attrib['value']
 				g = rev.find(self.ns + "gen")
@@ -286,12 +716,12 @@ class Statistics(object):
 					"Morph": "%s__%s" % (m.attrib['value'], m.attrib["checksum"]),
 					'':'',
 					#"Tests": OrderedDict(),
-					"Total": rev.find(self.ns + "total").text,
-					"Passes": rev.find(self.ns + "passes").text,
-					"Fails": rev.find(self.ns + "fails").text
+					"Total": _number(rev.find(self.ns + "total").text),
+					"Passes": _number(rev.find(self.ns + "passes").text),
+					"Fails": _number(rev.find(self.ns + "fails").text)
 				}
 			
-			#for j in i.find("tests").getiterator("test"):
+			#for j in i.find("tests").iter("test"):
 			#	hfsts[cfg][rev]['tests'][j.text] = {
 			#		"passes": j.attrib['passes'], 
 			#		"fails": j.attrib['fails']
@@ -299,6 +729,304 @@ class Statistics(object):
 
 		out = dict()
 		for k, v in morphs.items():
-			out[k] = OrderedDict(sorted(v.items()))
+			out[k] = OrderedDict(sorted(v.items(), key=_revision_order))
 
 		return out
+
+
+class SQLiteStatistics(Statistics):
+	"""Statistics kept in an SQLite database instead of one XML file.
+
+	Every revision element is a row, indexed on (section, key, revision),
+	so adding a result doesn't read or rewrite the rest of the history.
+	The XML format is kept through import_xml and export_xml.
+	"""
+	schema = """
+		CREATE TABLE IF NOT EXISTS results (
+			id INTEGER PRIMARY KEY,
+			section TEXT NOT NULL,
+			tag TEXT NOT NULL,
+			key TEXT,
+			attrs TEXT NOT NULL,
+			revision,
+			timestamp TEXT,
+			data BLOB NOT NULL
+		);
+		CREATE UNIQUE INDEX IF NOT EXISTS results_revision
+			ON results (section, key, revision, tag, attrs);
+		CREATE INDEX IF NOT EXISTS results_timestamp
+			ON results (section, timestamp);
+	"""
+	
+	def __init__(self, f=None, timeout=60):
+		Statistics.__init__(self)
+		self.f = f or ":memory:"
+		# Every add is its own short transaction, so concurrent frontends
+		# only ever wait (up to timeout) for one row to be written.
+		self.db = sqlite3.connect(self.f, timeout=timeout, isolation_level=None)
+		try:
+			self.db.execute("PRAGMA journal_mode=WAL")
+			self.db.executescript(self.schema)
+		except sqlite3.DatabaseError:
+			raise ParseError("File does not seem to be a statistics database.")
+		self.data_version = self._data_version()
+	
+	def _data_version(self):
+		return self.db.execute("PRAGMA data_version").fetchone()[0]
+	
+	def _refresh(self, tag):
+		# data_version changes when another connection commits
+		version = self._data_version()
+		if version != self.data_version:
+			self.data_version = version
+			self.views = {}
+	
+	@staticmethod
+	def _revision_value(value):
+		# Numeric revisions are stored as integers so that they sort as such
+		if value is not None and value.isdigit():
+			return int(value)
+		return value
+	
+	def _insert(self, section, node, child):
+		self.db.execute("""
+			INSERT INTO results (section, tag, key, attrs, revision, timestamp, data)
+			VALUES (?, ?, ?, ?, ?, ?, ?)
+			ON CONFLICT (section, key, revision, tag, attrs)
+			DO UPDATE SET timestamp = excluded.timestamp, data = excluded.data
+		""", (
+			section,
+			node.tag[len(self.ns):],
+			node.attrib.get("value"),
+			json.dumps(dict(node.attrib), sort_keys=True),
+			self._revision_value(child.attrib.get("value")),
+			child.attrib.get("timestamp"),
+			etree.tostring(child)
+		))
+	
+	def add(self, parent, xml):
+		if parent not in self.elements:
+			raise AttributeError("Element '%s' not supported." % parent)
+		
+		node = _qualify(etree.fromstring(xml), self.ns)
+		for child in node:
+			self._insert(parent, node, child)
+		self.views.pop(parent, None)
+	
+	def write(self):
+		# Every add is committed as it is made, unless in a transaction
+		if self.db.in_transaction:
+			self.db.execute("COMMIT")
+	
+	def close(self):
+		self.db.close()
+	
+	def get_root(self, tag):
+		"""Returns the section as an XML element, as in the XML file, or
+		None if it is empty."""
+		cur = self.db.execute("SELECT tag, attrs, data FROM results WHERE section = ? ORDER BY id", (tag,))
+		root = None
+		nodes = {}
+		for name, attrs, data in cur:
+			if root is None:
+				root = Element(self.ns + tag)
+			node = nodes.get((name, attrs))
+			if node is None:
+				node = nodes[(name, attrs)] = SubElement(root, self.ns + name, json.loads(attrs))
+			node.append(etree.fromstring(data))
+		return root
+	
+	def query(self, section, key=None, revisions=None, timestamps=None, limit=None, reverse=False):
+		if not section in self.elements:
+			raise AttributeError("Element not supported.")
+		
+		sql = ["SELECT tag, key, revision, timestamp, data FROM results WHERE section = ?"]
+		args = [section]
+		if key is not None:
+			sql.append("AND key = ?")
+			args.append(key)
+		for column, bounds in (("revision", revisions), ("timestamp", timestamps)):
+			if bounds is None:
+				continue
+			lo, hi = bounds
+			if column == "revision":
+				lo, hi = [None if i is None else self._revision_value(str(i)) for i in bounds]
+			else:
+				lo, hi = _timestamp(lo), _timestamp(hi)
+			if lo is not None:
+				sql.append("AND %s >= ?" % column)
+				args.append(lo)
+			if hi is not None:
+				sql.append("AND %s <= ?" % column)
+				args.append(hi)
+		order = " DESC" if reverse else ""
+		sql.append("ORDER BY revision%s, key%s" % (order, order))
+		if limit is not None:
+			sql.append("LIMIT ?")
+			args.append(limit)
+		
+		for tag, key, revision, timestamp, data in self.db.execute(" ".join(sql), args):
+			yield Record(section, tag, key, None if revision is None else str(revision),
+					timestamp, data=data)
+	
+	def section_names(self):
+		return [i[0] for i in self.db.execute(
+				"SELECT section FROM results GROUP BY section ORDER BY MIN(id)")]
+	
+	def compact(self, after=timedelta(days=90), resolution=timedelta(days=7), now=None):
+		now = now or datetime.utcnow()
+		step = resolution.total_seconds()
+		epoch = datetime(1970, 1, 1)
+		buckets = defaultdict(list)
+		for row in self.db.execute("""
+				SELECT id, section, tag, key, attrs, revision, timestamp FROM results
+				WHERE timestamp < ?""", ((now - after).isoformat(),)):
+			try:
+				t = from_isoformat(row[6])
+			except ValueError:
+				continue
+			buckets[row[1:5] + (int((t - epoch).total_seconds() // step),)].append(row)
+		
+		ids = []
+		for rows in buckets.values():
+			rows.sort(key=lambda r: _revision_key(r[5]))
+			ids.extend((r[0],) for r in rows[:-1])
+		
+		# Part of the caller's transaction if there is one, else its own
+		if self.db.in_transaction:
+			self.db.executemany("DELETE FROM results WHERE id = ?", ids)
+		else:
+			self.db.execute("BEGIN IMMEDIATE")
+			self.db.executemany("DELETE FROM results WHERE id = ?", ids)
+			self.db.execute("COMMIT")
+		self.views = {}
+		return len(ids)
+	
+	def import_xml(self, f):
+		"""Adds every result in the XML statistics file f."""
+		root = etree.parse(open(f, 'rb')).getroot()
+		if root.tag != self.ns + "statistics":
+			raise ParseError("File does not seem to be a statistics file.")
+		
+		self.db.execute("BEGIN IMMEDIATE")
+		try:
+			for section in root:
+				name = section.tag[len(self.ns):]
+				for node in section:
+					_qualify(node, self.ns)
+					for child in node:
+						self._insert(name, node, child)
+		except:
+			self.db.execute("ROLLBACK")
+			raise
+		self.db.execute("COMMIT")
+		self.views = {}
+	
+	def export_xml(self, f):
+		"""Writes every result to f as an XML statistics file."""
+		root = self.new_root()
+		for section in self.section_names():
+			root.append(self.get_root(section))
+		etree.ElementTree(root).write(f, encoding="utf-8", xml_declaration=True)
+
+
+class ShardedStatistics(Statistics):
+	"""Statistics kept in a directory with one gzipped XML file per section
+	(coverage.xml.gz, regression.xml.gz and so on).
+	
+	A section is only read when it is first used and only the sections
+	that changed are written back. Each shard is a statistics file of its
+	own with just that section in it.
+	"""
+	def load(self):
+		self.root = self.new_root()
+		self.tree = etree.ElementTree(self.root)
+		self.sections = {}
+		self.nodes = {}
+		self.revisions = {}
+		self.shards = {}
+		self.shard_stats = {}
+	
+	def _shard(self, section):
+		return pjoin(self.f, section + ".xml.gz")
+	
+	def _ensure(self, section):
+		"""Reads the shard of section if it hasn't been read yet."""
+		if section in self.shard_stats:
+			return
+		path = self._shard(section)
+		self.shard_stats[section] = _stat(path)
+		if self.shard_stats[section] is None:
+			return
+		
+		root = _read_tree(path).getroot()
+		if root.tag != self.ns + "statistics":
+			raise ParseError("%s does not seem to be a statistics file." % path)
+		node = root.find(self.ns + section)
+		if node is None:
+			node = SubElement(root, self.ns + section)
+		self.shards[section] = root
+		self.sections[section] = node
+		for i in node:
+			self._index_node(section, i)
+	
+	def _drop(self, section):
+		"""Forgets section, so that it is read again on next use."""
+		self.shards.pop(section, None)
+		self.sections.pop(section, None)
+		self.shard_stats.pop(section, None)
+		self.views.pop(section, None)
+		self.nodes = dict(i for i in self.nodes.items() if i[0][0] != section)
+		self.revisions = dict(i for i in self.revisions.items() if i[0][0] != section)
+	
+	def _refresh(self, tag):
+		"""Reads the shard of tag again if another process has written it
+		since."""
+		if tag in self.shard_stats and _stat(self._shard(tag)) != self.shard_stats[tag]:
+			self._drop(tag)
+			self._replay()
+	
+	def get_root(self, tag):
+		self._ensure(tag)
+		return self.sections.get(tag)
+	
+	def _new_section(self, parent):
+		root = self.shards[parent] = self.new_root()
+		node = self.sections[parent] = SubElement(root, self.ns + parent)
+		return node
+	
+	def section_names(self):
+		names = set(self.sections)
+		if os.path.isdir(self.f):
+			names.update(i[:-len(".xml.gz")] for i in os.listdir(self.f) if i.endswith(".xml.gz"))
+		return sorted(names)
+	
+	def write(self):
+		"""Saves the sections that changed, as Statistics.write does for
+		the whole file."""
+		os.makedirs(self.f, exist_ok=True)
+		with FileLock(pjoin(self.f, "statistics")):
+			changed = [i for i in self.shard_stats if _stat(self._shard(i)) != self.shard_stats[i]]
+			if changed:
+				for section in changed:
+					self._drop(section)
+				self._replay()
+			
+			for section in self.dirty:
+				if section in self.shards:
+					path = self._shard(section)
+					_write_tree(etree.ElementTree(self.shards[section]), path)
+					self.shard_stats[section] = _stat(path)
+			self.pending = []
+			self.dirty = set()
+
+
+def open_statistics(f):
+	"""Returns the Statistics for f: SQLiteStatistics for .db, .sqlite and
+	.sqlite3 files, ShardedStatistics for a directory (or a path ending in
+	a slash), the XML Statistics otherwise, gzipped if f ends in .gz."""
+	if os.path.splitext(f)[1].lower() in (".db", ".sqlite", ".sqlite3"):
+		return SQLiteStatistics(f)
+	if os.path.isdir(f) or f.endswith(os.sep):
+		return ShardedStatistics(f)
+	return Statistics(f)
@@ -1,12 +1,16 @@
 from xml.sax import SAXException
-from multiprocessing import Process, Pool, Queue, cpu_count
+from multiprocessing import Process, Pool, Queue, Event, Value, cpu_count
 from io import StringIO
 from queue import Empty
+from collections import Counter
+import json
 import sys
 import re
 import os
 import string
+import time
 import xml.sax.handler
+import yaml
 
 try:
 	from lxml import etree
@@ -19,10 +23,190 @@ from apertium.quality import schemas
 from mwtools import MediawikiHandler
 import nltk.data
 
+class _Keep(dict):
+	"""str.translate table that keeps chars and deletes everything else.
+	Other characters are added as they are met, so that after the first
+	few sentences every lookup is made in C."""
+	def __init__(self, chars):
+		dict.__init__(self, ((ord(c), c) for c in chars))
+	
+	def __missing__(self, key):
+		self[key] = None
+		return None
+
+
+class SentenceFilter(object):
+	"""Decides which sentences are fit for a corpus.
+	
+	One str.translate pass over a sentence keeps only the characters the
+	rules count (spaces, commas, digits, punctuation, dollar signs,
+	newlines and angle brackets), and the rules look at that short extract
+	instead of the sentence. Only banned words, and the currency rule when
+	there is a $, search the sentence itself again.
+	check() returns the first rule a sentence breaks, and filter(), which
+	takes a whole batch, keeps a Counter of them in rejected."""
+	reasons = ("newline", "markup", "leading punctuation", "words",
+			"commas", "punctuation", "banned word", "currency", "digits")
+	defaults = {
+		'minwords': 6,
+		'maxcomma': 2,
+		'maxpunc': 2,
+		'maxdigits': 6,
+		'punctuation': "#$%&\'()*+-/:;<=>?@[\\]^_`{|}~",
+		'banned': ["Wikipedia"]
+	}
+	
+	def __init__(self, minwords=6, maxcomma=2, maxpunc=2, maxdigits=6,
+			punctuation=None, banned=None):
+		self.minwords = int(minwords)
+		self.maxcomma = int(maxcomma)
+		self.maxpunc = int(maxpunc)
+		self.maxdigits = int(maxdigits)
+		self.punctuation = frozenset(self.defaults['punctuation'] if punctuation is None else punctuation)
+		self.banned = frozenset(self.defaults['banned'] if banned is None else banned)
+		self.digits = frozenset(string.digits)
+		self.rejected = Counter()
+		
+		self.table = _Keep(self.punctuation | self.digits | set(" ,\n<>$"))
+		self.punctuation_table = _Keep(self.punctuation)
+		self.digit_table = _Keep(self.digits)
+		self.currency = re.compile(r"\$[0-9]")
+	
+	@classmethod
+	def from_file(cls, f, **overrides):
+		"""Reads the rules from a YAML file of the keyword arguments, which
+		the ones in overrides that aren't None take precedence over."""
+		with open(f) as fp:
+			rules = yaml.safe_load(fp) or {}
+		unknown = set(rules) - set(cls.defaults)
+		if unknown:
+			raise ValueError("Unknown filter rules: %s" % ", ".join(sorted(unknown)))
+		rules.update((k, v) for k, v in overrides.items() if v is not None)
+		return cls(**rules)
+	
+	def check(self, data):
+		"""Returns the reason to reject data, or None to keep it."""
+		kept = data.translate(self.table)
+		if "\n" in kept:
+			return "newline"
+		if "<" in kept or ">" in kept:
+			return "markup"
+		if data[:1] in self.punctuation:
+			return "leading punctuation"
+		if self.minwords - 1 > kept.count(" "):
+			return "words"
+		if self.maxcomma < kept.count(","):
+			return "commas"
+		marks = kept.translate(self.punctuation_table)
+		for mark in set(marks):
+			if self.maxpunc < marks.count(mark):
+				return "punctuation"
+		for word in self.banned:
+			if word in data:
+				return "banned word"
+		if "$" in kept and self.currency.search(data):
+			return "currency"
+		if self.maxdigits < len(kept.translate(self.digit_table)):
+			return "digits"
+		return None
+	
+	def accepts(self, data):
+		return self.check(data) is None
+	
+	def filter(self, sentences):
+		"""Returns the stripped sentences to keep, counting the others'
+		reasons in rejected."""
+		out = []
+		for s in sentences:
+			s = s.strip()
+			reason = self.check(s)
+			if reason is None:
+				out.append(s)
+			else:
+				self.rejected[reason] += 1
+		return out
+
+
+class Batcher(object):
+	"""Puts items on a queue in lists of up to size items, or fewer if
+	they add up to max_bytes, so that each message carries many."""
+	def __init__(self, queue, size=64, max_bytes=1 << 20):
+		self.queue = queue
+		self.size = size
+		self.max_bytes = max_bytes
+		self.items = []
+		self.nbytes = 0
+	
+	def put(self, item, nbytes=0):
+		self.items.append(item)
+		self.nbytes += nbytes
+		if len(self.items) >= self.size or self.nbytes >= self.max_bytes:
+			self.flush()
+	
+	def flush(self):
+		if self.items:
+			self.queue.put(self.items)
+			self.items = []
+			self.nbytes = 0
+
+
+class Telemetry(object):
+	"""Counters shared by the extractor's processes, for sizing the number
+	of workers and the queues."""
+	def __init__(self, workers):
+		self.start = time.time()
+		self.bytes = Value('q', 0)
+		self.pages = Value('q', 0)
+		self.sentences = Value('q', 0)
+		self.written = Value('q', 0)
+		self.errors = Value('q', 0)
+		self.busy = [Value('d', 0.0) for i in range(workers)]
+		self.rejected = dict((i, Value('q', 0)) for i in SentenceFilter.reasons)
+	
+	def add(self, counter, n):
+		with counter.get_lock():
+			counter.value += n
+	
+	def snapshot(self, inq=None, outq=None):
+		elapsed = max(time.time() - self.start, 1e-9)
+		out = {
+			"elapsed": elapsed,
+			"bytes_read": self.bytes.value,
+			"pages": self.pages.value,
+			"pages_per_second": self.pages.value / elapsed,
+			"sentences": self.sentences.value,
+			"sentences_per_second": self.sentences.value / elapsed,
+			"written": self.written.value,
+			"errors": self.errors.value,
+			"busy": [i.value / elapsed for i in self.busy],
+			"rejected": dict((k, v.value) for k, v in self.rejected.items() if v.value)
+		}
+		for name, q in (("in_queue", inq), ("out_queue", outq)):
+			try:
+				out[name] = q.qsize()
+			except (AttributeError, NotImplementedError):
+				out[name] = None
+		return out
+	
+	def format(self, snap):
+		snap = dict(snap, nrejected=sum(snap['rejected'].values()))
+		return ("%(elapsed).0fs: %(bytes_read)d bytes read, %(pages)d pages " +
+				"(%(pages_per_second).1f/s), %(sentences)d sentences " +
+				"(%(sentences_per_second).1f/s), %(written)d written, %(nrejected)d rejected, " +
+				"%(errors)d pages failed, " +
+				"queues %(in_queue)s/%(out_queue)s, busy ") % snap + \
+				" ".join("%.0f%%" % (i * 100) for i in snap['busy']) + \
+				"".join("\n  %s: %d" % i for i in sorted(snap['rejected'].items()))
+
+
+class _Stop(Exception):
+	pass
+
+
 class CorpusExtractor(object):
 	class Handler(xml.sax.handler.ContentHandler):
 		def __init__(self, parent):
-			self.inq = parent.inq
+			self.put_page = parent.put_page
 			
 			self.inPage = False
 			self.inTitle = False
@@ -80,17 +264,42 @@ class CorpusExtractor(object):
 				self.inTitle = False
 			elif name == "text" and self.inRedirect == False and self.badText == False:
 				if (len(self.text.getvalue()) > 8):
-					self.inq.put((self.text.getvalue(), self.curTitle))
+					self.put_page(self.text.getvalue(), self.curTitle)
 			elif name == "mediawiki":
 				self.inMediawiki = False
 	
-	def __init__(self, fin, fout, cores=0, tokenizer=None, q=None, xml=False):
+	def __init__(self, fin, fout, cores=0, tokenizer=None, q=None, xml=False, parser=None,
+			batch=64, batch_bytes=1 << 20, stats=None, stats_file=None, filter=None):
+		"""q bounds both queues, in batches. A batch holds up to batch pages
+		(or their sentences), or fewer if their text reaches batch_bytes
+		characters. A full output queue holds the workers back, so memory
+		stays flat however slow the output is.
+		
+		Every stats seconds, the counters of Telemetry are printed to stderr
+		and, if stats_file is given, written to it as JSON.
+		
+		filter is the SentenceFilter that decides which sentences to keep."""
 		self.fin = fin
 		self.fout = fout
 		self.xml = xml
+		if parser is None:
+			parser = "lxml" if etree.__name__ == "lxml.etree" else "sax"
+		if parser not in ("lxml", "sax"):
+			raise ValueError("Unknown parser '%s'." % parser)
+		if parser == "lxml" and etree.__name__ != "lxml.etree":
+			raise ImportError("The lxml parser requires lxml.")
+		self.parser_type = parser
 		self.cores = int(cores or 0)
-		self.inq = Queue(q or 32)
-		self.outq = Queue()
+		self.batch = int(batch)
+		self.batch_bytes = int(batch_bytes)
+		self.inq = Queue(int(q or 32))
+		self.outq = Queue(int(q or 32))
+		self.stop = Event()
+		self.ended = Event()
+		self.filter = filter or SentenceFilter()
+		self.filters = {}
+		self.stats = float(stats) if stats else None
+		self.stats_file = stats_file
 		try:
 			if tokenizer:
 				self.tokenizer = nltk.data.load("file:" + tokenizer)
@@ -108,9 +317,11 @@ class CorpusExtractor(object):
 		self._start_processes()
 
 	def _make_processes(self, max_sentences):
+		self.nworkers = self.cores or cpu_count()
+		self.telemetry = Telemetry(self.nworkers)
 		self.parser = Process(target=self._parser, args=(self.fin,))
 		self.parser.daemon = True
-		self.workers = [Process(target=self.worker) for i in range(self.cores or cpu_count())]
+		self.workers = [Process(target=self.worker, args=(i,)) for i in range(self.nworkers)]
 		for w in self.workers:
 			w.daemon = True
 		if self.xml:
@@ -123,63 +334,205 @@ class CorpusExtractor(object):
 		for w in self.workers:	
 			w.start()
 		self.larry.start()
-
-		self.larry.join() #block some more.
-		for w in self.workers:
-			w.terminate() #block to end!
-		self.parser.terminate() # no more waiting.
+		
+		try:
+			last = time.time()
+			while self.larry.is_alive():
+				self.larry.join(min(self.stats or 1, 1))
+				self._check_workers()
+				if self.stats and time.time() - last >= self.stats:
+					self.report()
+					last = time.time()
+			
+			# The output worker stops early at the sentence limit, so drain
+			# whatever the workers still have to put until they see the end.
+			self.stop.set()
+			while self.parser.is_alive() or any(w.is_alive() for w in self.workers):
+				self._check_workers()
+				try:
+					self.outq.get(timeout=0.1)
+				except Empty:
+					pass
+			for w in self.workers:
+				w.join()
+			self.parser.join()
+		except KeyboardInterrupt:
+			for w in self.workers + [self.parser, self.larry]:
+				w.terminate()
+			raise
+		finally:
+			self.report(True)
+	
+	def _check_workers(self):
+		"""With no worker left, nothing takes the parser's batches, so it
+		can only block on the full queue, and the output worker only waits
+		for what is left in its queue."""
+		if any(w.is_alive() for w in self.workers):
+			return
+		if self.parser.is_alive():
+			sys.stderr.write("\nNo workers left, stopping the parser.\n")
+			self.parser.terminate()
+			self.parser.join()
+		self.ended.set()
+	
+	def report(self, final=False):
+		if not (self.stats or self.stats_file):
+			return
+		snap = self.telemetry.snapshot(self.inq, self.outq)
+		if self.stats:
+			sys.stderr.write("\n%s%s\n" % ("Total " if final else "", self.telemetry.format(snap)))
+			sys.stderr.flush()
+		if self.stats_file:
+			with open(self.stats_file, 'w') as f:
+				json.dump(snap, f, indent=1)
 
 	def _parser(self, fin):
+		"""Sends the pages of fin in batches, then one None per worker to
+		mark the end, also when parsing fails or is stopped."""
+		self.source = fin
+		self.pages = Batcher(self.inq, self.batch, self.batch_bytes)
+		try:
+			if self.parser_type == "lxml":
+				self._lxml_parser(fin)
+			else:
+				self._sax_parser(fin)
+			self.pages.flush()
+			self._tell()
+		except _Stop:
+			pass
+		except KeyboardInterrupt:
+			pass
+		finally:
+			for i in range(self.nworkers):
+				self.inq.put(None)
+	
+	def put_page(self, text, title):
+		if self.stop.is_set():
+			raise _Stop()
+		self.pages.put((text, title), len(text))
+		if not self.pages.items:
+			self._tell() # once a batch: tell() is slow on text and compressed files
+	
+	def _tell(self):
+		try:
+			self.telemetry.bytes.value = self.source.tell()
+		except (AttributeError, IOError, ValueError):
+			pass
+	
+	def _sax_parser(self, fin):
 		pid = os.getpid()
 		parser = xml.sax.make_parser()
 		parser.setContentHandler(self.Handler(self))
 		parser.parse(fin)
 		del parser
 	
-	def heuristics(self, data, minwords=6, maxcomma=2, maxpunc=2, maxdigits=6):
-		punc = "#$%&\'()*+-/:;<=>?@[\\]^_`{|}~"
-		if '\n' in data:
-			return False
-		if "<" in data or ">" in data:
-			return False
-		if data[0] in punc:
-			return False
-		if minwords-1 > data.count(' '):
-			return False
-		if maxcomma < data.count(','):
-			return False
-		for p in punc:
-			if maxpunc < data.count(p):
-				return False
-		if "Wikipedia" in data:
-			return False
-		if re.search(r'\$[0-9]', data):
-			return False
-		count = 0
-		for n in string.digits:
-			count += data.count(n)
-		if count > maxdigits:
-			return False
-		return True
-
-	def worker(self):
-		pid = os.getpid()
+	def _lxml_parser(self, fin):
+		"""The same filtering as Handler, on whole page elements from lxml's
+		iterparse, which are freed as soon as they have been read."""
+		fin = getattr(fin, 'buffer', fin) # lxml wants bytes
+		for _, page in etree.iterparse(fin, events=('end',), tag='{*}page'):
+			if etree.QName(page.getparent()).localname != "mediawiki":
+				raise IOError("Not a valid wikipedia dump.")
+			
+			title = ""
+			page_id = None
+			redirect = False
+			texts = []
+			for el in page.iter():
+				name = etree.QName(el).localname
+				if name == "id" and page_id is None:
+					page_id = (el.text or "").strip()
+				elif name == "title":
+					title = el.text or ""
+				elif name == "redirect":
+					redirect = True
+				elif name == "text" and not redirect:
+					texts.append(el.text or "")
+			
+			# conservative 10 to stop first few crazy pages
+			bad = title in (":", "Wikipedia", "Page") or \
+					(page_id is not None and int(page_id) < 10)
+			if not bad:
+				for text in texts:
+					if len(text) > 8:
+						self.put_page(text, title)
+			
+			page.clear()
+			while page.getprevious() is not None:
+				del page.getparent()[0]
+	
+	def heuristics(self, data, minwords=None, maxcomma=None, maxpunc=None, maxdigits=None):
+		"""Whether data is fit for the corpus, by self.filter or, if other
+		thresholds are given, by a filter made once for them."""
+		rules = (minwords, maxcomma, maxpunc, maxdigits)
+		if rules == (None, None, None, None):
+			return self.filter.accepts(data)
+		f = self.filters.get(rules)
+		if f is None:
+			f = self.filters[rules] = SentenceFilter(*[
+					getattr(self.filter, name) if value is None else value
+					for name, value in zip(("minwords", "maxcomma", "maxpunc", "maxdigits"), rules)],
+					punctuation=self.filter.punctuation, banned=self.filter.banned)
+		return f.accepts(data)
+
+	def worker(self, n=0):
+		"""Tokenises batches of pages until it gets None, which it passes
+		on to the output worker. Once stopped, batches are skipped. A page
+		that fails is reported and skipped."""
+		busy = self.telemetry.busy[n]
 		try:
 			while 1:
-				ch, title = self.inq.get(block=True)
-				if ch.strip() == "":
+				batch = self.inq.get(block=True)
+				if batch is None:
+					break
+				if self.stop.is_set():
 					continue
-				data = "[= %s =]\n\n%s" % (title, ch)
-				article = MediawikiHandler(data).parse()
-				del data
-				parsed = self.tokenizer.tokenize(article)
-				del article
-				self.outq.put(parsed)
-				del parsed
-		except Empty:
-			pass
+				start = time.time()
+				out = []
+				sentences = 0
+				for ch, title in batch:
+					if ch.strip() == "":
+						continue
+					try:
+						data = "[= %s =]\n\n%s" % (title, ch)
+						article = MediawikiHandler(data).parse()
+						del data
+						out.append(self.tokenizer.tokenize(article))
+						sentences += len(out[-1])
+						del article
+					except Exception as e:
+						self.telemetry.add(self.telemetry.errors, 1)
+						sys.stderr.write("\nSkipped page '%s': %s: %s\n" % (title, type(e).__name__, e))
+				self.telemetry.add(self.telemetry.pages, len(batch))
+				self.telemetry.add(self.telemetry.sentences, sentences)
+				busy.value += time.time() - start
+				if out:
+					self.outq.put(out)
+				del out
 		except KeyboardInterrupt:
 			pass
+		finally:
+			self.outq.put(None)
+	
+	def _count(self, written):
+		self.telemetry.add(self.telemetry.written, written)
+		for reason, n in self.filter.rejected.items():
+			self.telemetry.rejected[reason].value = n
+	
+	def _batches(self):
+		"""Yields the output queue's batches until every worker has ended."""
+		ended = 0
+		while ended < self.nworkers:
+			try:
+				batch = self.outq.get(block=True, timeout=1)
+			except Empty:
+				if self.ended.is_set(): # workers that died without saying so
+					return
+				continue
+			if batch is None:
+				ended += 1
+			else:
+				yield batch
 	
 	def output_worker(self, f, maxsentences=0):
 		pid = os.getpid()
@@ -190,21 +543,20 @@ class CorpusExtractor(object):
 			if f.mode != 'w':
 				f = open(f.name, 'w')
 
-			while 1:
-				if maxsentences > 0 and count >= maxsentences: 
-					break
-				sentencelist = self.outq.get(block=True, timeout=5)
-				for s in sentencelist:
-					if maxsentences > 0 and count >= maxsentences: 
-						break
-					if(self.heuristics(s.strip())):
-						f.write("%s\n" % s.strip())
-						count += 1
+			for batch in self._batches():
+				kept = self.filter.filter(s for sentencelist in batch for s in sentencelist)
+				if maxsentences > 0:
+					kept = kept[:maxsentences - count]
+				if kept:
+					f.write("\n".join(kept) + "\n")
+				count += len(kept)
 				f.flush()
+				self._count(len(kept))
 				sys.stdout.write('\r%d' % count)
 				sys.stdout.flush()
-		except Empty:
-			pass
+				if maxsentences > 0 and count >= maxsentences: 
+					self.stop.set()
+					break
 		except KeyboardInterrupt:
 			pass
 		finally:
@@ -228,24 +580,24 @@ class CorpusExtractor(object):
 				kwargs["xmlns"] = schemas['corpus']
 			
 			root = Element(ns + "corpus", **kwargs)
-			while 1:
-				if maxsentences > 0 and count >= maxsentences: 
-					break
-				sentencelist = self.outq.get(block=True, timeout=5)
-				el = Element(ns + "entry")
-				el.text = ""
-				for s in sentencelist:
+			for batch in self._batches():
+				written = count
+				for sentencelist in batch:
 					if maxsentences > 0 and count >= maxsentences: 
 						break
-					if(self.heuristics(s.strip())):
-						el.text += s.strip() + '\n'
-						count += 1
-				if el.text != "":
-					root.append(el)
+					kept = self.filter.filter(sentencelist)
+					if maxsentences > 0:
+						kept = kept[:maxsentences - count]
+					if kept:
+						el = SubElement(root, ns + "entry")
+						el.text = "\n".join(kept) + "\n"
+						count += len(kept)
+				self._count(count - written)
 				sys.stdout.write('\r%d' % count)
 				sys.stdout.flush()
-		except Empty:
-			pass
+				if maxsentences > 0 and count >= maxsentences: 
+					self.stop.set()
+					break
 		except KeyboardInterrupt:
 			pass
 		finally:
@@ -2,7 +2,8 @@ import sys, codecs
 from argparse import ArgumentParser
 
 from apertium.quality.testing import Test
-from apertium.quality import Statistics, ParseError
+from apertium.quality import open_statistics, ParseError
+from apertium.vcs import set_revision
 
 sys.stdout = codecs.getwriter("utf-8")(sys.stdout.detach())
 
@@ -16,7 +17,9 @@ class Frontend(Test, ArgumentParser):
 		if stats:
 			self.add_argument("-X", "--statistics", dest="statfile", 
 							  nargs='?', const='quality-stats.xml', default=None,
-							  help="XML file that statistics are to be stored in (Default: quality-stats.xml)")
+							  help="XML or SQLite (.db) file that statistics are to be stored in (Default: quality-stats.xml)")
+			self.add_argument("-r", "--revision", dest="revision", default=None,
+							  help="Revision to record results under (Default: detected from SVN or git)")
 
 	def start(self):
 		try:
@@ -28,8 +31,10 @@ class Frontend(Test, ArgumentParser):
 			
 			print(self.to_string())
 			if self.args.statfile:
+				if self.args.revision:
+					set_revision(self.args.revision)
 				try:
-					stats = Statistics(self.args.statfile)
+					stats = open_statistics(self.args.statfile)
 					stats.add(*self.to_xml())
 					stats.write()
 				except ParseError:
@@ -1,5 +1,6 @@
 from apertium.quality.testing import AutoTest
 from apertium.quality.frontend import Frontend
+from apertium.vcs import set_revision
 
 
 class UI(Frontend, AutoTest):
@@ -11,13 +12,20 @@ class UI(Frontend, AutoTest):
 					      help="Verbose test output")
 		self.add_argument("-X", "--statistics", dest="stats", 
                           nargs='?', const='quality-stats.xml', default=None,
-                          help="XML file that statistics are to be stored in")
+                          help="XML or SQLite (.db) file that statistics are to be stored in")
 		self.add_argument("-o", "--html", dest="outdir", nargs='?',
 						  const='htmlout', default=None, 
       					  help="Output directory for HTML content")
+		self.add_argument("-r", "--revision", dest="revision", default=None,
+						  help="Revision to record results under (Default: from the AQX file, or detected from SVN or git)")
+		self.add_argument("-T", "--timeout", dest="timeout", type=float, default=None,
+						  help="Seconds a tool may take on one input before it is killed")
 		self.add_argument("aqx", nargs=1, help="Apertium Quality XML configuration file")
 		self.args = args = self.parse_args()
-		AutoTest.__init__(self, self.args.stats, self.args.outdir, self.args.aqx[0], self.args.verbose)
+		AutoTest.__init__(self, self.args.stats, self.args.outdir, self.args.aqx[0], self.args.verbose,
+				self.args.timeout)
+		if self.args.revision:
+			set_revision(self.args.revision)
 		
 	def start(self):
 		try:
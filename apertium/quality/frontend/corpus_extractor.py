@@ -1,5 +1,5 @@
 import argparse, gzip, bz2
-from apertium.quality.corpora import CorpusExtractor
+from apertium.quality.corpora import CorpusExtractor, SentenceFilter
 
 class UI(object):
 	def __init__(self):
@@ -13,9 +13,29 @@ class UI(object):
 		ap.add_argument("-t", "--tokeniser", dest="tokeniser", nargs=1, required=False,
 			default=[None], help="""Tokeniser to use""")
 		ap.add_argument("-q", "--queue", dest="queue", nargs=1, required=False,
-			default=[None], help="""Set queue size (for advanced users)""")
+			default=[None], help="""Set queue size, in batches (for advanced users)""")
+		ap.add_argument("-b", "--batch", dest="batch", nargs=1, required=False,
+			default=[64], help="""Pages per batch sent between processes (default: 64)""")
+		ap.add_argument("-B", "--batch-bytes", dest="batch_bytes", nargs=1, required=False,
+			default=[1 << 20], help="""Send a batch early once its text reaches this many characters (default: 1048576)""")
+		ap.add_argument("-s", "--stats", dest="stats", nargs=1, required=False,
+			default=[None], help="""Print throughput counters to stderr every this many seconds""")
+		ap.add_argument("-S", "--stats-file", dest="stats_file", nargs=1, required=False,
+			default=[None], help="""Write throughput counters to this file as JSON""")
+		ap.add_argument("-r", "--rules", dest="rules", nargs=1, required=False,
+			default=[None], help="""YAML file of sentence filter rules (minwords, maxcomma, maxpunc, maxdigits, punctuation, banned)""")
+		ap.add_argument("--min-words", dest="minwords", nargs=1, required=False,
+			default=[None], help="""Fewest words in a sentence (default: 6)""")
+		ap.add_argument("--max-commas", dest="maxcomma", nargs=1, required=False,
+			default=[None], help="""Most commas in a sentence (default: 2)""")
+		ap.add_argument("--max-punctuation", dest="maxpunc", nargs=1, required=False,
+			default=[None], help="""Most of any one punctuation mark in a sentence (default: 2)""")
+		ap.add_argument("--max-digits", dest="maxdigits", nargs=1, required=False,
+			default=[None], help="""Most digits in a sentence (default: 6)""")
 		ap.add_argument("-x", "--xml", dest="xml", action="store_true",
 			help="Output corpora in XML format")
+		ap.add_argument("-p", "--parser", dest="parser", choices=("lxml", "sax"), default=None,
+			help="""XML parser for the dump (default: lxml if installed, else sax)""")
 		ap.add_argument("wikidump", nargs=1, help="Wikipedia XML dump")
 		ap.add_argument("outfile", nargs=1, help="Output filename")
 		
@@ -25,11 +45,21 @@ class UI(object):
 		elif self.args.wikidump[0].endswith(".bz2"):
 			wikidump = bz2.BZ2File(self.args.wikidump[0])
 		else:
-			wikidump = open(self.args.wikidump[0])
+			wikidump = open(self.args.wikidump[0], 'rb')
 			
+		rules = dict((k, getattr(self.args, k)[0]) for k in
+				("minwords", "maxcomma", "maxpunc", "maxdigits"))
+		if self.args.rules[0]:
+			sfilter = SentenceFilter.from_file(self.args.rules[0], **rules)
+		else:
+			sfilter = SentenceFilter(**dict((k, v) for k, v in rules.items() if v is not None))
+		
 		self.corpus = CorpusExtractor(wikidump, open(self.args.outfile[0], 'w'), 
-				self.args.cores[0], self.args.tokeniser[0],
-				xml=self.args.xml)
+				self.args.cores[0], self.args.tokeniser[0], self.args.queue[0],
+				xml=self.args.xml, parser=self.args.parser,
+				batch=self.args.batch[0], batch_bytes=self.args.batch_bytes[0],
+				stats=self.args.stats[0], stats_file=self.args.stats_file[0],
+				filter=sfilter)
 	
 	def start(self):
 		self.corpus.generate(int(self.args.count[0]))
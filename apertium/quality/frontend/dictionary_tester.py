@@ -8,12 +8,17 @@ class UI(Frontend, DictionaryTest):
         self.add_argument("-d", "--dict", dest="dictdir", nargs='?',
             const=['.'], default=['.'],
             help="Directory of dictionary (Default: current directory)")
+        self.add_argument("--cache-dir", dest="cachedir", default=None,
+            help="Directory for the parse cache (Default: $AQ_CACHE_DIR or ~/.cache/apertium-quality)")
+        self.add_argument("--no-cache", dest="cachedir", action="store_false",
+            help="Parse every file again instead of using the parse cache")
         # TODO add direction
         # TODO add trules option
         # should allow LR, RL and both at same time with multiple flags
         self.add_argument("langpair", nargs=1, help="Language pair (eg aa-ab)")
         self.args = self.parse_args()
-        DictionaryTest.__init__(self, self.args.langpair[0], self.args.dictdir[0])
+        DictionaryTest.__init__(self, self.args.langpair[0], self.args.dictdir[0],
+                                cache=self.args.cachedir)
 
 def main():
     try:
@@ -1,6 +1,7 @@
 from apertium.quality.frontend import Frontend
 from apertium.quality.testing import MorphTest
-from apertium.quality import Statistics
+from apertium.quality import open_statistics
+from apertium.vcs import set_revision
 
 class UI(Frontend, MorphTest):
 	def __init__(self):
@@ -39,6 +40,9 @@ class UI(Frontend, MorphTest):
 		self.add_argument("-v", "--verbose",
 			dest="verbose", action="store_true",
 			help="More verbose output.")
+		self.add_argument("-T", "--timeout",
+			dest="timeout", type=float, default=None,
+			help="Seconds a lookup may take before it is killed")
 		
 		self.add_argument("--app", dest="app", nargs=1, required=False, 
 			help="Override application used for test")
@@ -61,7 +65,9 @@ class UI(Frontend, MorphTest):
 		ret = self.run()
 		print(self.to_string())
 		if self.args.get('statfile'):
-			stats = Statistics(self.args['statfile'])
+			if self.args.get('revision'):
+				set_revision(self.args['revision'])
+			stats = open_statistics(self.args['statfile'])
 			stats.add(*self.to_xml())
 			stats.write()
 		self.exit(ret)
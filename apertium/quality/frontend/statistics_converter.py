@@ -0,0 +1,77 @@
+import argparse
+import os
+import shutil
+from datetime import timedelta
+
+from apertium.quality import open_statistics, SQLiteStatistics, etree
+
+class UI(object):
+	def __init__(self):
+		ap = argparse.ArgumentParser(
+			description="Convert statistics between the XML, gzipped XML (.xml.gz), " +
+				"SQLite (.db) and sharded (directory) formats, and compact their history.")
+		ap.add_argument("-a", "--compact-after", dest="after", type=int, default=None,
+			help="Compact history older than this many days")
+		ap.add_argument("-R", "--resolution", dest="resolution", type=int, default=7,
+			help="Days of compacted history per kept revision (Default: 7)")
+		ap.add_argument("-s", "--section", dest="section", default=None,
+			help="Section to write as CSV when output ends in .csv")
+		ap.add_argument("input", nargs=1, help="Statistics to read")
+		ap.add_argument("output", nargs='?', default=None,
+			help="Statistics to write, a directory if it ends in a slash (Default: compact input in place)")
+		self.args = ap.parse_args()
+
+	def start(self):
+		src, dst = self.args.input[0], self.args.output
+		if not os.path.exists(src):
+			raise SystemExit("%s does not exist." % src)
+		if dst is not None and os.path.exists(dst):
+			raise SystemExit("%s already exists." % dst)
+		
+		stats = open_statistics(src)
+		if dst is not None and dst.endswith(".csv"):
+			if self.args.section is None:
+				raise SystemExit("Give the section to write with -s.")
+			stats.to_csv(self.args.section, dst)
+			return
+		if dst is None:
+			self.convert(stats)
+			return
+		
+		out = open_statistics(dst)
+		try:
+			if isinstance(out, SQLiteStatistics):
+				out.db.execute("BEGIN IMMEDIATE") # one transaction, committed by write()
+			for section in stats.section_names():
+				for node in stats.get_root(section):
+					out.add(section, etree.tostring(node))
+			self.convert(out)
+			if isinstance(out, SQLiteStatistics):
+				out.close()
+		except:
+			# Leave nothing half-written behind, so that it can be run again
+			if isinstance(out, SQLiteStatistics):
+				out.close()
+			if os.path.isdir(dst):
+				shutil.rmtree(dst)
+			for f in (dst, dst + "-wal", dst + "-shm", dst + ".lock"):
+				if os.path.isfile(f):
+					os.unlink(f)
+			raise
+	
+	def convert(self, stats):
+		"""Compacts stats if asked to and writes them."""
+		if self.args.after is not None:
+			n = stats.compact(timedelta(days=self.args.after), timedelta(days=self.args.resolution))
+			print("Removed %d revisions." % n)
+		stats.write()
+
+def main():
+	try:
+		ui = UI()
+		ui.start()
+	except KeyboardInterrupt:
+		pass
+
+if __name__ == "__main__":
+	main()
@@ -1,23 +1,49 @@
 import argparse
+from glob import glob
 from os.path import basename, abspath
 
-from apertium.quality import Statistics
-from apertium.quality.html import Webpage
+from apertium.quality import open_statistics
+from apertium.quality.html import Webpage, Dashboard
 
 #TODO add piping for great interfacing
 
+def points(value):
+	n = int(value)
+	if 0 < n < 3:
+		raise argparse.ArgumentTypeError("%s: give 0 for every point, or at least 3" % value)
+	return n
+
 class UI(object):
 	def __init__(self):
 		ap = argparse.ArgumentParser(
-			description="Generate webpage and related files.")
+			description="Generate webpage and related files. Given several statistics " +
+				"files (or a glob), generates a site per pair and an index of them.")
 		ap.add_argument("-t", "--title", dest="title", nargs='?',
 			const=basename(abspath('.')), default=basename(abspath('.')),
 			help="Directory of dictionary (Default: current directory)")
-		ap.add_argument("statistics", nargs=1, help="Statistics file")
+		ap.add_argument("-p", "--points", dest="points", type=points, default=500,
+			help="Most points per chart series, 0 for all (Default: 500)")
+		ap.add_argument("-m", "--method", dest="method", choices=("lttb", "minmax"), default="lttb",
+			help="Downsampling method (Default: lttb)")
+		ap.add_argument("-a", "--assets", dest="assets", default=None,
+			help="Directory to take the JavaScript files from (Default: the ones installed with apertium-quality)")
+		ap.add_argument("-j", "--jobs", dest="jobs", type=int, default=None,
+			help="Pairs to generate at once (Default: number of CPUs)")
+		ap.add_argument("statistics", nargs='+', help="Statistics files (XML or SQLite)")
 		ap.add_argument("outdir", nargs=1, help="Output directory")
 		self.args = args = ap.parse_args()
-		self.stats = Statistics(args.statistics[0])
-		self.web = Webpage(self.stats, args.outdir[0], args.title)
+		
+		files = []
+		for f in args.statistics:
+			files.extend(sorted(glob(f)) or [f])
+		
+		if len(files) == 1:
+			self.stats = open_statistics(files[0])
+			self.web = Webpage(self.stats, args.outdir[0], args.title,
+					args.points or None, args.method, args.assets)
+		else:
+			self.web = Dashboard(files, args.outdir[0], args.title,
+					args.points or None, args.method, args.assets, args.jobs)
 	
 	def start(self):
 		self.web.generate()
@@ -29,3 +55,5 @@ def main():
 	except KeyboardInterrupt:
 		pass
 
+if __name__ == "__main__":
+	main()
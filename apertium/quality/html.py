@@ -1,15 +1,81 @@
 from collections import OrderedDict
 from datetime import datetime
-import urllib.request
+from hashlib import sha1
+from multiprocessing import Pool
+from html import escape
+import filecmp
+import shutil
 import os.path
 import json
 import re
 
+from apertium.checksum import checksum
+from apertium.quality import open_statistics
+
 pjoin = os.path.join
 
+static_dir = pjoin(os.path.dirname(os.path.abspath(__file__)), "static")
+
+# The scripts the page uses, in load order, shipped as package data
+scripts = (
+    "jquery.js",
+    "raphael.js",
+    "raphael_linechart.js",
+    "rgbcolor.js",
+    "canvg.js"
+)
+
+def html_escape(value):
+    return escape(str(value))
+
+def write_if_changed(path, data):
+    """Writes data to path unless it already holds it. Returns the SHA1
+    of data."""
+    data = data.encode('utf-8')
+    digest = sha1(data).hexdigest()
+    try:
+        with open(path, 'rb') as f:
+            if f.read() == data:
+                return digest
+    except OSError:
+        pass
+    
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    tmp = path + ".tmp"
+    with open(tmp, 'wb') as f:
+        f.write(data)
+    os.replace(tmp, path)
+    return digest
+
+def install_asset(name, assets, fdir):
+    """Hard-links (or copies) asset name from the directory assets into
+    fdir, unless an identical file is there already. Returns its SHA1."""
+    src = pjoin(assets, name)
+    dst = pjoin(fdir, name)
+    if not os.path.exists(src):
+        if os.path.exists(dst):
+            return checksum(dst) # left by an earlier run
+        raise IOError("Missing asset %s: put it in %s or give another directory with assets." % (name, assets))
+    
+    if os.path.exists(dst) and (os.path.samefile(src, dst) or filecmp.cmp(src, dst, shallow=False)):
+        return checksum(dst)
+    
+    os.makedirs(fdir, exist_ok=True)
+    tmp = dst + ".tmp"
+    if os.path.exists(tmp):
+        os.unlink(tmp)
+    try:
+        os.link(src, tmp)
+    except OSError:
+        shutil.copyfile(src, tmp)
+    os.replace(tmp, dst)
+    return checksum(dst)
+
+
 class Webpage(object):
     """Generate a webpage and supporting files from a given Statistics file"""
     space = re.compile('[ /:\n]')
+    unsafe = re.compile(r'[^\w.-]')
     
     head = """<head>
     <meta http-equiv="Content-Type" content="text/html; charset=UTF-8" />
@@ -31,7 +97,7 @@ class Webpage(object):
         Save as: <a onclick="saveSvg()">SVG</a> <a onclick="savePng()">PNG(800)</a> <a onclick="savePng(1024, 768)">PNG(1024)</a>
     </div>
     <div id="chart"></div>
-    <div id="footer">{footer}</div>
+    <div id="footer"><span id="generated"></span> <a id="full">Full data</a></div>
 </div>
 </body>"""
 
@@ -42,73 +108,273 @@ class Webpage(object):
 </html>
 """
     
-    def __init__(self, stats, fdir, title):
+    def __init__(self, stats, fdir, title, points=500, method="lttb", assets=None, asset_url=None):
+        """points is the most points a chart series gets, None for all of
+        them. assets is the directory the scripts are taken from, the
+        package's static directory by default. With asset_url the scripts
+        are loaded from there (e.g. "../assets/") instead of being put in
+        fdir."""
         self.stats = stats
         try: os.makedirs(fdir)
         except: pass
         self.fdir = fdir
         self.title = title
+        self.points = points
+        self.method = method
+        self.assets = assets or static_dir
+        self.asset_url = asset_url
 
     def generate(self):
-        footer = "Generated: %s" % datetime.utcnow().strftime("%Y-%m-%d %H:%M (UTC)")
+        """Writes the site, rewriting only the files whose content changed.
         
-        chart_data = {}
-        chart_data.update(self._coverage())
-        chart_data.update(self._regression())
-        chart_data.update(self._ambiguity())
-        chart_data.update(self._general())
-        
-        scripts = OrderedDict((
-                ("jquery.js", "http://code.jquery.com/jquery-1.6.2.min.js"),
-                ("raphael.js", "https://github.com/DmitryBaranovskiy/raphael/raw/master/raphael-min.js"),
-                ("raphael_linechart.js", "https://github.com/bbqsrc/raphael-linechart/raw/master/js/raphael_linechart.js"),
-                ("rgbcolor.js", "http://canvg.googlecode.com/svn/trunk/rgbcolor.js"),
-                ("canvg.js", "http://canvg.googlecode.com/svn/trunk/canvg.js")
-        ))
+        The data of every chart is a script of its own, named after a
+        hash of its content and loaded by the page with a script tag when
+        the chart is chosen, so that the site also works from file://.
+        manifest.json lists every file generated, and stats.js says when
+        the site last changed.
+        """
+        full_data = self._chart_data()
+        chart_data = self._chart_data(self.points) if self.points else full_data
         
+        files = OrderedDict()
         script_html = ''
-        for script, url in scripts.items():
-            script_html += '\t<script charset="utf-8" type="text/javascript" src="%s"></script>\n' % script
-            if not os.path.exists(pjoin(self.fdir, script)):
-                data = urllib.request.urlopen(url).read()
-                f = open(pjoin(self.fdir, script), 'wb')
-                f.write(data)
-                f.close()
+        for script in scripts:
+            if self.asset_url is None:
+                files[script] = install_asset(script, self.assets, self.fdir)
+                url = script
+            else:
+                url = self.asset_url + script
+            script_html += '\t<script charset="utf-8" type="text/javascript" src="%s"></script>\n' % url
         script_html += '\t<script charset="utf-8" type="text/javascript" src="stats.js"></script>\n'
-                
-        writes = {
-                "stats.js": js % json.dumps(chart_data),
-                "index.html": self.base.format(head=self.head.format(scripts=script_html), body=self.body.format(title=self.title, footer=footer)),
-                "style.css": core_css, #self.css,
-                "menu.css": menu_css
-        }
         
+        index = {}
+        full_index = {}
+        for section, charts in chart_data.items():
+            index[section] = {}
+            full_index[section] = {}
+            for chart, series in charts.items():
+                index[section][chart] = {}
+                full_index[section][chart] = {}
+                for key, data in series.items():
+                    name = self.unsafe.sub("_", "%s-%s-%s" % (section, chart, key))
+                    fn = index[section][chart][key] = self._data_file(files, name, data)
+                    full = full_data[section][chart][key]
+                    if full != data: # thinned
+                        fn = self._data_file(files, name + ".full", full)
+                    full_index[section][chart][key] = fn
+        
+        # The time of the last run is kept unless something else changed
+        old = self._manifest()
+        stats_js = js % (json.dumps(index, sort_keys=True), json.dumps(full_index, sort_keys=True))
+        writes = OrderedDict((
+                ("stats.js", self._stats_js(stats_js, old.get("generated"))),
+                ("index.html", self.base.format(head=self.head.format(scripts=script_html), body=self.body.format(title=self.title))),
+                ("style.css", core_css), #self.css,
+                ("menu.css", menu_css)
+        ))
         for fn, data in writes.items():
-            f = open(pjoin(self.fdir, fn), 'w')
-            f.write(data)
-            f.close()
+            files[fn] = self._write(fn, data)
         
-    def _coverage(self):
+        # Chart data from earlier runs that no chart uses any more
+        for fn in old.get("files", {}):
+            if fn.startswith("data/") and fn not in files:
+                try: os.unlink(pjoin(self.fdir, fn))
+                except OSError: pass
+        
+        if old.get("title") == self.title and old.get("files") == files:
+            return # unchanged, so is the time it was generated
+        generated = datetime.utcnow().strftime("%Y-%m-%d %H:%M (UTC)")
+        files["stats.js"] = self._write("stats.js", self._stats_js(stats_js, generated))
+        manifest = {
+            "title": self.title,
+            "files": files,
+            "generated": generated
+        }
+        self._write("manifest.json", json.dumps(manifest, indent=1, sort_keys=True))
+    
+    def _manifest(self):
+        try:
+            with open(pjoin(self.fdir, "manifest.json")) as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+    
+    def _write(self, fn, data):
+        return write_if_changed(pjoin(self.fdir, fn), data)
+    
+    def _stats_js(self, stats_js, generated):
+        return "var generated = %s;\n%s" % (json.dumps(generated), stats_js)
+    
+    def _data_file(self, files, name, data):
+        """Writes a chart's data as data/name.<hash>.js, a script that
+        passes it to dataLoaded(), unless it is already there, records it
+        in files and returns its name."""
+        data = json.dumps(data, sort_keys=True)
+        fn = "data/%s.%s.js" % (name, sha1(data.encode('utf-8')).hexdigest()[:12])
+        data = "dataLoaded(%s, %s);\n" % (json.dumps(fn), data)
+        digest = sha1(data.encode('utf-8')).hexdigest()
+        if not os.path.exists(pjoin(self.fdir, fn)):
+            self._write(fn, data)
+        files[fn] = digest
+        return fn
+    
+    def _chart_data(self, points=None):
+        """Every chart's series, thinned to points points if given."""
+        chart_data = {}
+        chart_data.update(self._coverage(points))
+        chart_data.update(self._regression(points))
+        chart_data.update(self._ambiguity(points))
+        chart_data.update(self._general(points))
+        return chart_data
+    
+    def _coverage(self, points=None):
         out = {'Coverage Testing':{}}
-        out['Coverage Testing']['Coverage Over Time'] = self.stats.get_raphael("coverage", "Percent", "Known", "Total")
+        out['Coverage Testing']['Coverage Over Time'] = self.stats.get_raphael("coverage", "Percent", "Known", "Total",
+                points=points, method=self.method)
         return out
     
-    def _regression(self):
+    def _regression(self, points=None):
         out = {'Regression Testing':{}}
-        out['Regression Testing']['Regressions Over Time'] = self.stats.get_raphael("regression", "Percent", "Passes", "Total")
+        out['Regression Testing']['Regressions Over Time'] = self.stats.get_raphael("regression", "Percent", "Passes", "Total",
+                points=points, method=self.method)
         return out
     
-    def _ambiguity(self):
+    def _ambiguity(self, points=None):
         out = {'Ambiguity Testing':{}}
-        out['Ambiguity Testing']['Mean Ambiguity Over Time'] = self.stats.get_raphael("ambiguity", "Average", "Average", "Surface forms")
+        out['Ambiguity Testing']['Mean Ambiguity Over Time'] = self.stats.get_raphael("ambiguity", "Average", "Average", "Surface forms",
+                points=points, method=self.method)
         return out
     
-    def _general(self):
+    def _general(self, points=None):
         out = {'Dictionary Testing':{}}
-        out['Dictionary Testing']['Dictionary Entries Over Time'] = self.stats.get_raphael("general", "Entries", "Entries", "Unique entries")
+        out['Dictionary Testing']['Dictionary Entries Over Time'] = self.stats.get_raphael("general", "Entries", "Entries", "Unique entries",
+                points=points, method=self.method)
         return out
 
 
+def pair_name(f):
+    """Name of the pair whose statistics are in f: the file's name without
+    extensions, or its directory's for generic names like
+    quality-stats.xml, without the apertium- prefix."""
+    path = os.path.abspath(f).rstrip(os.sep)
+    name = os.path.basename(path).split(".")[0]
+    if name in ("", "quality-stats", "statistics", "stats"):
+        name = os.path.basename(os.path.dirname(path))
+    if name.startswith("apertium-"):
+        name = name[len("apertium-"):]
+    return name
+
+def _build_site(job):
+    """Generates one pair's site in a worker process and returns its
+    headline metrics."""
+    f, fdir, title, points, method, asset_url = job
+    stats = open_statistics(f)
+    Webpage(stats, fdir, title, points, method, asset_url=asset_url).generate()
+    
+    out = OrderedDict()
+    for section, label, field in Dashboard.headlines:
+        latest = OrderedDict()
+        for record in stats.query(section, reverse=True):
+            if record.key not in latest:
+                latest[record.key] = (record.revision, record.get(field))
+        out[label] = latest
+    return title, out
+
+
+class Dashboard(object):
+    """Sites for many pairs at once, built in parallel.
+    
+    Every pair gets a site in a subdirectory of fdir; the scripts are put
+    once in fdir/assets and shared, and fdir/index.html lists each pair's
+    latest headline metrics.
+    """
+    headlines = (
+        ("coverage", "Coverage", "percent"),
+        ("regression", "Regressions", "percent"),
+        ("ambiguity", "Ambiguity", "average"),
+        ("general", "Entries", "entries")
+    )
+    
+    page = """<!DOCTYPE html>
+<html>
+<head>
+    <meta http-equiv="Content-Type" content="text/html; charset=UTF-8" />
+    <title>{title}</title>
+    <link rel="stylesheet" type="text/css" href="assets/style.css" />
+</head>
+<body>
+<div id="container" class="minimal">
+    <div id="header"><h1 id="subtitle">{title}</h1></div>
+    <table id="pairs">
+        <tr><th>Pair</th>{headings}</tr>
+{rows}
+    </table>
+</div>
+</body>
+</html>
+"""
+    
+    def __init__(self, files, fdir, title="Apertium", points=500, method="lttb", assets=None, workers=None):
+        self.files = list(files)
+        self.fdir = fdir
+        self.title = title
+        self.points = points
+        self.method = method
+        self.assets = assets or static_dir
+        self.workers = workers
+    
+    def jobs(self):
+        names = {}
+        for f in self.files:
+            name = pair_name(f)
+            n = names[name] = names.get(name, 0) + 1
+            if n > 1:
+                name = "%s-%d" % (name, n)
+            yield (f, pjoin(self.fdir, name), name, self.points, self.method, "../assets/")
+    
+    def generate(self):
+        assets = pjoin(self.fdir, "assets")
+        for script in scripts:
+            install_asset(script, self.assets, assets)
+        write_if_changed(pjoin(assets, "style.css"), core_css + index_css)
+        
+        jobs = list(self.jobs())
+        if len(jobs) == 1 or self.workers == 1:
+            results = [_build_site(job) for job in jobs]
+        else:
+            with Pool(self.workers) as pool:
+                results = pool.map(_build_site, jobs)
+        
+        rows = []
+        for name, metrics in sorted(results):
+            cells = []
+            for label, latest in metrics.items():
+                cells.append("<td>%s</td>" % "<br />".join(
+                    "%s: %s (r%s)" % (html_escape(key), html_escape(value), html_escape(rev))
+                    for key, (rev, value) in latest.items()))
+            rows.append('        <tr><td><a href="%s/index.html">%s</a></td>%s</tr>' % (
+                html_escape(name), html_escape(name), "".join(cells)))
+        
+        headings = "".join("<th>%s</th>" % label for section, label, field in self.headlines)
+        write_if_changed(pjoin(self.fdir, "index.html"), self.page.format(
+            title=html_escape(self.title), headings=headings, rows="\n".join(rows)))
+        return dict(results)
+
+
+index_css = """
+#pairs {
+    width: 100%;
+    margin-top: 60px;
+    background-color: #fff;
+    border-collapse: collapse;
+    text-align: left; }
+
+#pairs th, #pairs td {
+    padding: 4px 8px;
+    border-bottom: 1px solid #ccc;
+    vertical-align: top; }
+"""
+
 menu_css = """ul { 
     list-style: none; 
 }
@@ -177,10 +443,14 @@ ul.dropdown ul ul                     { left: 100%; top: 0; }
 ul.dropdown li:hover > ul             { visibility: visible; }"""
 
 js = """var data = %s;
+var full = %s;
 var w = 800 - 20;
 var h = Math.round(window.innerHeight / 2);
 var title = null;
 var cur_data = null;
+var cur_url = null;
+var loaded = {};
+var waiting = {};
 var div = "chart";
 var chart = null;
 
@@ -188,9 +458,32 @@ function setData(title, subtitle, dat) {
     $("#title").empty().append(title);
     $("#subtitle").empty().append(subtitle);
     $("#subsubtitle").empty().append(dat);
-    cur_data = data[title][subtitle][dat];
-    $("#" + div).empty();
-    makeChart();
+    $("#full").attr("href", full[title][subtitle][dat]);
+    
+    var url = cur_url = data[title][subtitle][dat];
+    function show(d) {
+        if (url != cur_url) return; // another chart was chosen meanwhile
+        cur_data = loaded[url] = d;
+        $("#" + div).empty();
+        makeChart();
+    }
+    if (loaded[url]) show(loaded[url]);
+    else {
+        // A script tag rather than XHR, which file:// pages can't use
+        waiting[url] = show;
+        var script = document.createElement("script");
+        script.src = url;
+        document.getElementsByTagName("head")[0].appendChild(script);
+    }
+}
+
+function dataLoaded(url, d) {
+    loaded[url] = d;
+    if (waiting[url]) {
+        var show = waiting[url];
+        delete waiting[url];
+        show(d);
+    }
 }
 
 function makeChart() {
@@ -268,6 +561,7 @@ function savePng(pw, ph) {
 }
 
 window.onload = function() {
+    if (generated) $("#generated").text("Generated: " + generated);
     generateMenu();
     (function() {for (var i in data) { for (var ii in data[i]) { for (var iii in data[i][ii]) { 
         title = iii; setData(i, ii, iii); return;  }}}; })(); //data[i][ii][iii];
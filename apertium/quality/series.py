@@ -0,0 +1,91 @@
+"""Downsampling of chart series.
+
+Both functions take the y values of a series (x being evenly spaced, as
+chart points are) and return the sorted indices of the points to keep,
+always including the first and the last.
+"""
+
+def lttb(ys, points):
+	"""Largest-Triangle-Three-Buckets: keeps the points that best preserve
+	the visual shape of the series."""
+	n = len(ys)
+	if points >= n:
+		return list(range(n))
+
+	keep = [0]
+	size = (n - 2) / (points - 2)
+	a = 0
+	for i in range(points - 2):
+		start = int(i * size) + 1
+		end = int((i + 1) * size) + 1
+
+		# Average of the next bucket (the last point for the last bucket)
+		nstart, nend = end, min(int((i + 2) * size) + 1, n)
+		if nstart >= n - 1:
+			avg_x, avg_y = n - 1, ys[n - 1]
+		else:
+			avg_x = (nstart + nend - 1) / 2.0
+			avg_y = sum(ys[nstart:nend]) / (nend - nstart)
+
+		best, best_area = start, -1
+		ax, ay = a, ys[a]
+		for j in range(start, end):
+			area = abs((ax - avg_x) * (ys[j] - ay) - (ax - j) * (avg_y - ay))
+			if area > best_area:
+				best, best_area = j, area
+		keep.append(best)
+		a = best
+
+	keep.append(n - 1)
+	return keep
+
+def minmax(ys, points):
+	"""Keeps the lowest and highest point of each of points / 2 buckets,
+	so that no spike disappears."""
+	n = len(ys)
+	if points >= n:
+		return list(range(n))
+
+	buckets = (points - 2) // 2
+	keep = set((0, n - 1))
+	if buckets == 0:
+		return sorted(keep)
+	size = (n - 2) / buckets
+	for i in range(buckets):
+		start = int(i * size) + 1
+		end = max(int((i + 1) * size) + 1, start + 1)
+		bucket = range(start, min(end, n - 1))
+		if len(bucket) == 0:
+			continue
+		keep.add(min(bucket, key=ys.__getitem__))
+		keep.add(max(bucket, key=ys.__getitem__))
+	return sorted(keep)
+
+methods = {
+	"lttb": lttb,
+	"minmax": minmax
+}
+
+def downsample(ys, points, method="lttb"):
+	"""Returns the indices of ys to keep to have at most points points."""
+	if method not in methods:
+		raise ValueError("Unknown downsampling method '%s'." % method)
+	if points < 3:
+		raise ValueError("Can't downsample to fewer than 3 points.")
+	return methods[method](ys, points)
+
+def thin(series, points, method="lttb"):
+	"""Downsamples a chart series, a dict of parallel lists whose 'data'
+	list holds the y values, to at most points points. A series that is
+	short enough or isn't numeric is returned as is."""
+	if len(series.get('data', ())) <= points:
+		return series
+	try:
+		ys = [float(i) for i in series['data']]
+	except (TypeError, ValueError):
+		return series
+	keep = downsample(ys, points, method)
+	out = series.copy()
+	for name, values in series.items():
+		out[name] = [values[i] for i in keep]
+	return out
@@ -0,0 +1,134 @@
+/*
+ * raphael_linechart.js - line charts for Raphael 2
+ *
+ * Written for apertium-quality, after the interface of bbqsrc's
+ * raphael-linechart (https://github.com/bbqsrc/raphael-linechart), and
+ * released under CC0 with the rest of the package.
+ *
+ * paper.lineChart(options) draws options.data, an object with arrays
+ * labels, data, lines1 and lines2 (one entry per point), and returns a
+ * set of everything drawn. Hovering near a point shows its label and
+ * lines.
+ *
+ * Options: width, height, gutter {top, bottom, left, right}, show_area,
+ * x_labels_step (label every nth point), y_labels_count, colors {master},
+ * hide_dots (don't draw dots when there are more points than this) and
+ * mouse_coords ('rect' for a hover area per point, 'circle' for the
+ * dots only).
+ */
+(function () {
+    function merge(a, b) {
+        var out = {}, k;
+        for (k in a) out[k] = a[k];
+        for (k in b) {
+            if (b[k] !== null && typeof b[k] == "object" && !(b[k] instanceof Array) && typeof a[k] == "object") {
+                out[k] = merge(a[k], b[k]);
+            } else {
+                out[k] = b[k];
+            }
+        }
+        return out;
+    }
+
+    var defaults = {
+        data: {labels: [], data: [], lines1: [], lines2: []},
+        width: 600,
+        height: 250,
+        gutter: {top: 12, bottom: 24, left: 30, right: 0},
+        show_area: false,
+        x_labels_step: 1,
+        y_labels_count: 4,
+        colors: {master: "#01A8F0", text: "#333", grid: "#ddd", popup: "#000"},
+        hide_dots: 0,
+        mouse_coords: "rect"
+    };
+
+    Raphael.fn.lineChart = function (options) {
+        var o = merge(defaults, options || {}),
+            paper = this,
+            d = o.data,
+            n = d.data.length,
+            g = o.gutter,
+            all = paper.set();
+        if (!n) return all;
+
+        var values = [], i;
+        for (i = 0; i < n; i++) values.push(parseFloat(d.data[i]) || 0);
+        var lo = Math.min.apply(Math, values),
+            hi = Math.max.apply(Math, values);
+        if (lo == hi) { lo -= 1; hi += 1; }
+
+        var left = g.left + 40, top = g.top,
+            w = o.width - left - g.right,
+            h = o.height - g.top - g.bottom,
+            step = n > 1 ? w / (n - 1) : 0;
+
+        function x(i) { return Math.round(left + (n > 1 ? step * i : w / 2)); }
+        function y(v) { return Math.round(top + h - (v - lo) / (hi - lo) * h); }
+
+        // Grid and y labels
+        var count = Math.max(o.y_labels_count, 1);
+        for (i = 0; i <= count; i++) {
+            var v = lo + (hi - lo) * i / count, gy = y(v);
+            all.push(paper.path(["M", left, gy, "H", left + w]).attr({stroke: o.colors.grid}));
+            all.push(paper.text(left - 6, gy, Math.round(v * 100) / 100)
+                .attr({"text-anchor": "end", fill: o.colors.text}));
+        }
+
+        // x labels
+        var every = Math.max(o.x_labels_step || 1, 1);
+        for (i = 0; i < n; i += every) {
+            all.push(paper.text(x(i), top + h + g.bottom / 2, d.labels[i]).attr({fill: o.colors.text}));
+        }
+
+        // The line, and the area under it
+        var line = [];
+        for (i = 0; i < n; i++) line.push(i ? "L" : "M", x(i), y(values[i]));
+        if (o.show_area) {
+            all.push(paper.path(line.concat(["L", x(n - 1), top + h, "L", x(0), top + h, "Z"]))
+                .attr({fill: o.colors.master, "fill-opacity": 0.2, stroke: "none"}));
+        }
+        all.push(paper.path(line).attr({stroke: o.colors.master, "stroke-width": 2, "stroke-linejoin": "round"}));
+
+        // Popup with the label and lines of the point under the mouse
+        var popup = paper.set(),
+            box = paper.rect(0, 0, 10, 10, 4).attr({fill: o.colors.popup, "fill-opacity": 0.75, stroke: "none"}),
+            text = paper.text(0, 0, "").attr({fill: "#fff", "text-anchor": "start"});
+        popup.push(box, text).hide();
+
+        function show(i) {
+            var lines = [d.labels[i]];
+            if (d.lines1 && d.lines1[i] !== undefined) lines.push(d.lines1[i]);
+            if (d.lines2 && d.lines2[i] !== undefined) lines.push(d.lines2[i]);
+            text.attr({text: lines.join("\n")});
+            var bb = text.getBBox(), px = x(i) + 10, py = y(values[i]) - bb.height / 2 - 6;
+            if (px + bb.width + 12 > o.width) px = x(i) - bb.width - 22;
+            py = Math.max(0, Math.min(py, o.height - bb.height - 12));
+            text.attr({x: px + 6, y: py + 6 + bb.height / 2});
+            box.attr({x: px, y: py, width: bb.width + 12, height: bb.height + 12});
+            popup.show().toFront();
+        }
+        function hide() { popup.hide(); }
+
+        var dots = !o.hide_dots || n <= o.hide_dots;
+        for (i = 0; i < n; i++) {
+            var dot = null;
+            if (dots) {
+                dot = paper.circle(x(i), y(values[i]), 3).attr({fill: "#fff", stroke: o.colors.master, "stroke-width": 2});
+                all.push(dot);
+            }
+            var target = dot;
+            if (o.mouse_coords == "rect" || !dot) {
+                var rw = n > 1 ? step : w;
+                target = paper.rect(x(i) - rw / 2, top, rw, h).attr({fill: "#fff", "fill-opacity": 0, stroke: "none"});
+                all.push(target);
+            }
+            (function (i) {
+                target.hover(function () { show(i); }, hide);
+            })(i);
+        }
+
+        all.push(popup);
+        return all;
+    };
+})();
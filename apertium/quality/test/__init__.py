@@ -0,0 +1,19 @@
+from datetime import datetime, timedelta
+
+from apertium.quality import Element, SubElement, etree
+
+
+def coverage(rev, percent=None, day=None):
+	"""A coverage result for revision rev of apertium-xx.xx.dix, as XML.
+	
+	percent defaults to rev, and the result is timestamped day days after
+	2011-10-01, rev days by default."""
+	node = Element('dictionary', value='apertium-xx.xx.dix')
+	timestamp = datetime(2011, 10, 1) + timedelta(days=rev if day is None else day)
+	r = SubElement(node, 'revision', value=str(rev),
+			timestamp=timestamp.strftime('%Y-%m-%dT%H:%M:%S.%f'), checksum='abc')
+	SubElement(r, 'corpus', value='corpus.txt', checksum='def')
+	for name, value in (('percent', str(rev if percent is None else percent)),
+			('total', '10'), ('known', '5'), ('unknown', '5')):
+		SubElement(r, name).text = value
+	return etree.tostring(node)
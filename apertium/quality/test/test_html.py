@@ -0,0 +1,59 @@
+import filecmp
+import os
+import shutil
+import tempfile
+import unittest
+
+from apertium.quality import Statistics
+from apertium.quality.html import Dashboard, scripts, static_dir
+from apertium.quality.test import coverage
+
+pjoin = os.path.join
+
+
+class DashboardTest(unittest.TestCase):
+	def setUp(self):
+		self.dir = tempfile.mkdtemp()
+		self.files = []
+		for pair in ("apertium-aa-bb", "apertium-cc-dd"):
+			f = pjoin(self.dir, pair + ".xml")
+			stats = Statistics(f)
+			for rev in range(5):
+				stats.add("coverage", coverage(rev, str(80 + rev)))
+			stats.write()
+			self.files.append(f)
+		self.out = pjoin(self.dir, "web")
+
+	def tearDown(self):
+		shutil.rmtree(self.dir)
+
+	def test_packaged_assets(self):
+		"""Builds without an assets directory, in worker processes."""
+		results = Dashboard(self.files, self.out, "Test", workers=2).generate()
+		self.assertEqual(sorted(results), ["aa-bb", "cc-dd"])
+		self.assertEqual(results["aa-bb"]["Coverage"]["apertium-xx.xx.dix"], ("4", "84"))
+
+		with open(pjoin(self.out, "index.html")) as f:
+			index = f.read()
+		self.assertIn('href="aa-bb/index.html"', index)
+		self.assertIn('href="cc-dd/index.html"', index)
+
+		for name in results:
+			with open(pjoin(self.out, name, "index.html")) as f:
+				page = f.read()
+			for script in scripts:
+				self.assertIn('src="../assets/%s"' % script, page)
+			self.assertTrue(os.path.exists(pjoin(self.out, name, "stats.js")))
+
+		# Each script once, in the shared directory
+		found = {}
+		for path, dirs, files in os.walk(self.out):
+			for f in files:
+				found.setdefault(f, []).append(path)
+		for script in scripts:
+			self.assertEqual(found.get(script), [pjoin(self.out, "assets")])
+			self.assertTrue(filecmp.cmp(pjoin(static_dir, script), pjoin(self.out, "assets", script), shallow=False))
+
+
+if __name__ == "__main__":
+	unittest.main()
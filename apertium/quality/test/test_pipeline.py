@@ -0,0 +1,57 @@
+import sys
+import time
+import unittest
+
+from apertium.engine import ProcessTimeout
+from apertium.pipeline import Pipeline
+
+def python(code):
+	return [sys.executable, "-c", code]
+
+count = python("import sys\nfor i in range(int(sys.argv[1])): print(i)")
+upper = python("import sys\nsys.stdout.write(sys.stdin.read().upper())")
+
+def evens(chunks):
+	"""Keeps the even numbers, whichever way the lines are split."""
+	rest = b""
+	for chunk in chunks:
+		lines = (rest + chunk).split(b"\n")
+		rest = lines.pop()
+		yield b"".join(b"n%s\n" % i for i in lines if int(i) % 2 == 0)
+
+
+class PipelineTest(unittest.TestCase):
+	def test_transform(self):
+		seen = []
+		pipeline = Pipeline()
+		pipeline.add(count + ["50000"], name="count", tap=seen.append, transform=evens)
+		pipeline.add(upper, name="upper")
+		out = pipeline.run()
+
+		expected = "".join("n%d\n" % i for i in range(0, 50000, 2))
+		self.assertEqual(out, expected.upper())
+		self.assertEqual(b"".join(seen).decode('utf-8'), expected)
+
+		stats = pipeline.stats()
+		self.assertEqual([s["name"] for s in stats], ["count", "upper"])
+		self.assertEqual(stats[0]["bytes_out"], len("".join("%d\n" % i for i in range(50000))))
+		self.assertEqual(stats[1]["bytes_in"], len(expected))
+		self.assertIn("count", pipeline.report())
+
+	def test_transform_error(self):
+		def fail(chunks):
+			for chunk in chunks:
+				raise ValueError("bad chunk")
+				yield chunk
+		pipeline = Pipeline().add(count + ["10"], transform=fail).add(upper)
+		self.assertRaises(ValueError, pipeline.run)
+
+	def test_timeout(self):
+		pipeline = Pipeline(count + ["10"], python("import time\ntime.sleep(60)"))
+		begin = time.time()
+		self.assertRaises(ProcessTimeout, pipeline.run, timeout=0.5)
+		self.assertLess(time.time() - begin, 10)
+
+
+if __name__ == "__main__":
+	unittest.main()
@@ -0,0 +1,63 @@
+import os
+import shutil
+import tempfile
+import unittest
+
+from apertium.quality import Statistics, SQLiteStatistics, ShardedStatistics
+from apertium.quality.test import coverage
+
+pjoin = os.path.join
+
+
+class ViewsTest(unittest.TestCase):
+	"""Views are rebuilt when another writer changes the statistics."""
+	def setUp(self):
+		self.dir = tempfile.mkdtemp()
+		self.opened = []
+
+	def tearDown(self):
+		for stats in self.opened:
+			if hasattr(stats, "close"):
+				stats.close()
+		shutil.rmtree(self.dir)
+
+	def open(self, cls, f):
+		stats = cls(f)
+		self.opened.append(stats)
+		return stats
+
+	def check(self, cls, name):
+		f = pjoin(self.dir, name)
+		writer = self.open(cls, f)
+		writer.add("coverage", coverage(1))
+		writer.write()
+
+		reader = self.open(cls, f)
+		view = reader.get("coverage")
+		self.assertEqual(list(view["apertium-xx.xx.dix"]), ["1"])
+		self.assertIs(reader.get("coverage"), view)
+
+		writer.add("coverage", coverage(2))
+		writer.write()
+		view = reader.get("coverage")
+		self.assertEqual(sorted(view["apertium-xx.xx.dix"]), ["1", "2"])
+
+		# Changes of its own are kept too
+		reader.add("coverage", coverage(4))
+		writer.add("coverage", coverage(3))
+		writer.write()
+		view = reader.get("coverage")
+		self.assertEqual(sorted(view["apertium-xx.xx.dix"]), ["1", "2", "3", "4"])
+
+	def test_xml(self):
+		self.check(Statistics, "stats.xml")
+
+	def test_sqlite(self):
+		self.check(SQLiteStatistics, "stats.db")
+
+	def test_sharded(self):
+		self.check(ShardedStatistics, "stats")
+
+
+if __name__ == "__main__":
+	unittest.main()
@@ -0,0 +1,77 @@
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import unittest
+
+from apertium.quality import Statistics, open_statistics
+from apertium.quality.test import coverage
+
+pjoin = os.path.join
+root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+# The frontends replace sys.stdout when imported, so they are run apart
+run = """import sys
+from apertium.quality import Statistics, SQLiteStatistics
+from apertium.quality.frontend.statistics_converter import main
+if sys.argv[1] == "fail":
+	def fail(*args):
+		raise RuntimeError("compaction failed")
+	Statistics.compact = SQLiteStatistics.compact = fail
+sys.argv[1:2] = []
+main()
+"""
+
+
+class StatisticsConverterTest(unittest.TestCase):
+	def setUp(self):
+		self.dir = tempfile.mkdtemp()
+		self.xml = pjoin(self.dir, "x.xml")
+		stats = Statistics(self.xml)
+		for rev in range(1, 57):
+			stats.add("coverage", coverage(rev, day=rev - 1))
+		stats.write()
+
+	def tearDown(self):
+		shutil.rmtree(self.dir)
+
+	def convert(self, *args, fail=False):
+		env = dict(os.environ, PYTHONPATH=os.pathsep.join([root, os.environ.get('PYTHONPATH', '')]))
+		return subprocess.run([sys.executable, "-c", run, "fail" if fail else "ok"] + list(args),
+				env=env, stdout=subprocess.PIPE, stderr=subprocess.PIPE, universal_newlines=True)
+
+	def revisions(self, f):
+		stats = open_statistics(f)
+		out = [i.revision for i in stats.query("coverage")]
+		if hasattr(stats, "close"):
+			stats.close()
+		return out
+
+	def test_compact_to_sqlite(self):
+		db = pjoin(self.dir, "y.db")
+		proc = self.convert("-a", "30", self.xml, db)
+		self.assertEqual(proc.returncode, 0, proc.stderr)
+		self.assertIn("Removed", proc.stdout)
+		compacted = self.revisions(db)
+		self.assertTrue(0 < len(compacted) < 56)
+		self.assertEqual(compacted[-1], "56")
+
+		# The same as compacting the XML file itself
+		xml = pjoin(self.dir, "y.xml")
+		self.assertEqual(self.convert("-a", "30", self.xml, xml).returncode, 0)
+		self.assertEqual(self.revisions(xml), compacted)
+
+	def test_failure_leaves_nothing(self):
+		db = pjoin(self.dir, "y.db")
+		proc = self.convert("-a", "30", self.xml, db, fail=True)
+		self.assertNotEqual(proc.returncode, 0)
+		self.assertIn("compaction failed", proc.stderr)
+		self.assertEqual(os.listdir(self.dir), ["x.xml"])
+
+		self.assertEqual(self.convert(self.xml, db).returncode, 0)
+		self.assertEqual(len(self.revisions(db)), 56)
+
+
+if __name__ == "__main__":
+	unittest.main()
@@ -0,0 +1,85 @@
+import random
+import unittest
+
+from apertium import destxt, retxt, retxt_stream, RetxtDecoder
+from apertium.stream import scan
+
+def splits(data):
+	"""data cut in two at every point, and in single characters."""
+	for i in range(len(data) + 1):
+		yield [data[:i], data[i:]]
+	yield list(data)
+
+
+class RetxtTest(unittest.TestCase):
+	samples = [
+		"a\\b",
+		"\\\\\\",
+		"trailing\\",
+		"x\ny\tz\r",
+		" [ not a newline ]",
+		"^word/analysis<n>$ [bracket] @at {brace}",
+		"\\\\\\^odd and \\\\even"
+	]
+
+	def test_split_escapes(self):
+		for s in self.samples:
+			encoded = destxt(s)
+			for chunks in splits(encoded):
+				self.assertEqual("".join(retxt_stream(chunks)), s, chunks)
+
+	def test_held_back(self):
+		decoder = RetxtDecoder()
+		# An odd run of backslashes may escape the next chunk's first char
+		self.assertEqual(decoder.decode("ab\\\\\\"), "ab\\")
+		self.assertEqual(decoder.decode("$c"), "$c")
+		# An even run doesn't
+		self.assertEqual(decoder.decode("d\\\\"), "d\\")
+		# " [\n" is held until it is known whether "]" follows
+		self.assertEqual(decoder.decode("e ["), "e")
+		self.assertEqual(decoder.decode("\n"), "")
+		self.assertEqual(decoder.decode("x"), " [\nx")
+		self.assertEqual(decoder.decode(" [\t"), "")
+		self.assertEqual(decoder.decode("]", True), "\t")
+
+	def test_random(self):
+		rng = random.Random(1)
+		alphabet = "ab \n\t\r[]\\/@<>^${}"
+		for n in range(200):
+			s = "".join(rng.choice(alphabet) for i in range(rng.randint(0, 30)))
+			encoded = destxt(s)
+			cuts = sorted(rng.randint(0, len(encoded)) for i in range(3))
+			chunks = [encoded[i:j] for i, j in zip([0] + cuts, cuts + [len(encoded)])]
+			self.assertEqual("".join(retxt_stream(chunks)), s, chunks)
+			self.assertEqual(retxt(encoded), s)
+
+
+class ScanTest(unittest.TestCase):
+	def raw(self, data):
+		return [unit.raw for unit in scan(data)]
+
+	def test_split_units(self):
+		data = "^a/a<n>$ [^not/a$ \\] unit] \\^b\\$ ^c\\$d/c\\$d<n>$[\\[]^e\\/f/*e\\/f$"
+		expected = ["a/a<n>", "c\\$d/c\\$d<n>", "e\\/f/*e\\/f"]
+		self.assertEqual(self.raw(data), expected)
+		for chunks in splits(data):
+			self.assertEqual(self.raw(chunks), expected, chunks)
+
+	def test_units(self):
+		units = list(scan(["^c\\$", "d/c\\$d<n>$ ^x/*x$"]))
+		self.assertEqual(units[0].surface, "c$d")
+		self.assertEqual(units[0].analyses, ("c\\$d<n>",))
+		self.assertTrue(units[1].unknown)
+
+	def test_unterminated(self):
+		for data, expected in (
+				("^a$ ^b", ["a"]),
+				("[^x$", ["x"]),
+				("^a$ \\", ["a"]),
+				("^a\\$", [])):
+			for chunks in splits(data):
+				self.assertEqual(self.raw(chunks), expected, chunks)
+
+
+if __name__ == "__main__":
+	unittest.main()
@@ -1,6 +1,5 @@
 from os.path import dirname, basename, abspath
 from collections import defaultdict, Counter, OrderedDict
-from multiprocessing import Process, Manager
 from subprocess import Popen, PIPE
 from xml.sax import make_parser
 from xml.sax.handler import ContentHandler
@@ -8,7 +7,6 @@ from io import StringIO
 from glob import glob
 from datetime import datetime
 from hashlib import sha1
-from tempfile import NamedTemporaryFile
 from math import sqrt
 import os
 import os.path
@@ -27,17 +25,21 @@ except:
 	import xml.etree.ElementTree as etree
 	from xml.etree.ElementTree import Element, SubElement
 
-from apertium import whereis, destxt, retxt, DixFile, process
-from apertium.quality import Statistics, schemas
+from apertium import destxt, destxt_stream, \
+		read_chunks, DixFile, process, process_many, get_session, get_cache, \
+		ProcessError, ProcessTimeout
+from apertium.stream import scan
+from apertium.pipeline import Pipeline
+from apertium.checksum import checksum_many
+from apertium.vcs import get_revision, set_revision
+from apertium.tools import get_tools
+from apertium.quality import open_statistics, schemas
 from apertium.quality.html import Webpage
 
 pjoin = os.path.join
 ARROW = "\u2192"
 
 
-class UncleanWorkingDirectoryException(Exception):
-	pass
-
 class Test(object):
 	"""Abstract class for Test objects
 	
@@ -47,6 +49,7 @@ class Test(object):
 	
 	"""Attributes"""
 	timer = None
+	timeout = None # seconds a tool may take on one input, None for no limit
 	
 	def __str__(self):
 		"""Will return to_string method's content if exists, 
@@ -63,15 +66,31 @@ class Test(object):
 			data = data.encode('utf-8')
 		return sha1(data).hexdigest()
 	
-	def _svn_revision(self, directory):
-		"""Returns the SVN revision of the given dictionary directory"""
-		whereis(['svnversion'])
-		res = Popen('svnversion', stdout=PIPE, close_fds=True).communicate()[0].decode('utf-8').strip()
-		try:
-			int(res) # will raise error if it can't be int'd
-			return str(res)
-		except:
-			raise UncleanWorkingDirectoryException("You must have a clean SVN directory. Commit or remove uncommitted files.")
+	def _file_checksum(self, *paths):
+		"""Returns the checksum of the file at each path (the same hash as
+		_checksum), memoized and hashed in parallel. With a single path the
+		checksum itself is returned."""
+		res = checksum_many(paths)
+		return res[0] if len(paths) == 1 else res
+	
+	def _revision(self, directory):
+		"""Returns the revision (SVN or git) of the given dictionary directory"""
+		return get_revision(directory)
+	
+	_svn_revision = _revision
+	
+	def _require(self, programs):
+		"""Looks programs up in the tool registry, raising EnvironmentError
+		if one is missing, and remembers them for _tool_versions."""
+		self.programs = get_tools().require(programs)
+		return self.programs
+	
+	def _tool_versions(self, parent):
+		"""Adds a tool element with the version of each required program
+		to parent, usually the system element."""
+		tools = get_tools()
+		for name in sorted(getattr(self, 'programs', ())):
+			SubElement(parent, 'tool', name=name, version=tools.version(name) or "")
 	
 	def run(self, *args, **kwargs):
 		"""Runs the actual test
@@ -102,13 +121,19 @@ class Test(object):
 class AmbiguityTest(Test):
 	delim = re.compile(":[<>]:")
 
-	def __init__(self, f, **kwargs):
+	def __init__(self, f, timeout=None, **kwargs):
 		self.f = kwargs.get('f', f)
+		self.timeout = kwargs.get('timeout', timeout)
 		self.program = "lt-expand"
-		whereis([self.program])
+		self._require([self.program])
 	
-	def get_results(self):
-		res, err = process([self.program, self.f])
+	def command(self):
+		return [self.program, self.f]
+	
+	def get_results(self, res=None):
+		"""Parses the output of command(), running it unless res is given."""
+		if res is None:
+			res, err = process(self.command(), timeout=self.timeout)
 		self.results = self.delim.sub(":", res).split('\n')
 
 	def get_ambiguity(self):
@@ -125,9 +150,9 @@ class AmbiguityTest(Test):
 		
 		self.average = float(self.total) / float(self.surface_forms)
 
-	def run(self):
+	def run(self, res=None):
 		timing_begin = time.time()
-		self.get_results()
+		self.get_results(res)
 		self.get_ambiguity()
 		self.timer = time.time() - timing_begin
 		return 0
@@ -136,9 +161,9 @@ class AmbiguityTest(Test):
 		q = Element('dictionary')
 		q.attrib["value"] = self.f
 
-		r = SubElement(q, "revision", value=str(self._svn_revision(dirname(self.f))))
+		r = SubElement(q, "revision", value=str(self._revision(dirname(self.f))))
 		r.attrib['timestamp'] = datetime.utcnow().isoformat()
-		r.attrib['checksum'] = self._checksum(open(self.f, 'rb').read())
+		r.attrib['checksum'] = self._file_checksum(self.f)
 
 		SubElement(r, 'surface-forms').text = str(self.surface_forms)
 		SubElement(r, 'analyses').text = str(self.total)
@@ -156,11 +181,15 @@ class AmbiguityTest(Test):
 class AutoTest(Test):
 	ns = "{%s}" % schemas['config']
 	
-	def __init__(self, stats=None, webdir=None, aqx=None, verbose=None, **kwargs):
+	def __init__(self, stats=None, webdir=None, aqx=None, verbose=None, timeout=None, **kwargs):
 		self.stats = kwargs.get('stats', stats)
 		self.webdir = kwargs.get('webdir', webdir)
 		self.aqx = kwargs.get('aqx', aqx)
 		self.verbose = kwargs.get('verbose', verbose)
+		# A hung tool fails its test instead of stalling the whole run
+		self.timeout = kwargs.get('timeout', timeout)
+		if self.timeout:
+			self.timeout = float(self.timeout)
 		
 		if self.aqx is None:
 			raise ValueError('A configuration file is required')
@@ -169,10 +198,13 @@ class AutoTest(Test):
 		self.lang1, self.lang2 = self.langpair.split('-')
 		
 		if self.stats:
-			self.stats = Statistics(self.stats)
+			self.stats = open_statistics(self.stats)
 		
 		if self.aqx:
 			self.root = etree.parse(self.aqx).getroot()
+			revision = self.root.find(self.ns + "revision")
+			if revision is not None and revision.text:
+				set_revision(revision.text.strip())
 	
 	def build(self):
 		commands = self.root.find(self.ns + "commands")
@@ -198,11 +230,25 @@ class AutoTest(Test):
 			return
 		
 		print("[-] Ambiguity Tests")
+		tests = []
 		for d in dixen:
+			try:
+				tests.append((d, AmbiguityTest(d, self.timeout)))
+			except:
+				print("[-] File: %s" % d)
+				print("[!] Error:")
+				traceback.print_exc()
+		
+		# The dictionaries are expanded side by side, no more at once than
+		# there are CPUs, as each expansion is held in memory until it ends
+		results = process_many([dict(command=test.command(), timeout=self.timeout)
+				for d, test in tests], concurrency=os.cpu_count())
+		for (d, test), res in zip(tests, results):
 			print("[-] File: %s" % d)
 			try:
-				test = AmbiguityTest(d)
-				test.run()
+				if isinstance(res, BaseException):
+					raise res
+				test.run(res[0])
 			except:
 				print("[!] Error:")
 				traceback.print_exc()
@@ -244,7 +290,7 @@ class AutoTest(Test):
 					continue
 			
 			try:
-				test = CoverageTest(path, "%s.automorf.bin" % lang)
+				test = CoverageTest(path, "%s.automorf.bin" % lang, timeout=self.timeout)
 				test.run()
 			except:
 				print("[!] Error:")
@@ -299,7 +345,7 @@ class AutoTest(Test):
 					continue
 			
 			try:
-				test = GenerationTest('.', lang, path)
+				test = GenerationTest('.', lang, path, timeout=self.timeout)
 				test.run()
 			except:
 				print("[!] Error:")
@@ -328,7 +374,7 @@ class AutoTest(Test):
 				continue
 				
 			try:
-				test = MorphTest(path)
+				test = MorphTest(path, timeout=self.timeout)
 				test.run()
 			except:
 				print("[!] Error:")
@@ -363,7 +409,7 @@ class AutoTest(Test):
 					continue
 				
 			try:
-				test = RegressionTest(path, language)
+				test = RegressionTest(path, language, timeout=self.timeout)
 				test.run()
 			except:
 				print("[!] Error:")
@@ -376,7 +422,7 @@ class AutoTest(Test):
 	def vocabulary(self):
 		print("[-] Vocabulary Tests")
 		try:
-			test = VocabularyTest("lr", self.lang1, self.lang2, "voctest.txt", '.')
+			test = VocabularyTest("lr", self.lang1, self.lang2, "voctest.txt", '.', timeout=self.timeout)
 			test.run()
 		except:
 			print("[!] Error:")
@@ -413,10 +459,11 @@ class CoverageTest(Test):
 	app = "lt-proc"
 	app_args = []
 	
-	def __init__(self, fn=None, dct=None, hfst=None, **kwargs):
+	def __init__(self, fn=None, dct=None, hfst=None, timeout=None, **kwargs):
 		fn = kwargs.get('fn', fn)
 		dct = kwargs.get('dct', dct)
 		hfst = kwargs.get('hfst', hfst)
+		self.timeout = kwargs.get('timeout', timeout)
 		if None in (fn, dct):
 			raise TypeError("fn or dct parameter missing.")
 		
@@ -424,7 +471,7 @@ class CoverageTest(Test):
 			self.app = "hfst-proc"
 			self.app_args = ['-w']
 			
-		whereis([self.app])
+		self._require([self.app])
 		self.dct = dct
 		self.result = None
 		self.fn = fn
@@ -449,49 +496,43 @@ class CoverageTest(Test):
 			raise # TODO: wrap error for output
 		
 		if not self.result:
-			delim = re.compile(r"\$[^^]*\^")
-			f = open(self.fn, 'r')			
-			data = f.read()
-			f.close()
-
-			output = destxt(data).encode('utf-8')
+			f = open(self.fn, 'r')
+			
+			# Stream the corpus through the codec, the transducer and the
+			# scanner so only the lexical units are ever held in memory.
 			timing_begin = time.time()
-			proc = Popen([self.app] + self.app_args + [self.dct], stdin=PIPE, stdout=PIPE, close_fds=True)
-			output = str(proc.communicate(output)[0].decode('utf-8'))
+			session = get_session(self.app, self.app_args, self.dct)
+			self.result = list(scan(session.stream(destxt_stream(read_chunks(f)), self.timeout)))
 			self.timer = time.time() - timing_begin
-			output = retxt(output) 
-			
-			output = delim.sub("$\n^", output)
-			self.result = output.split('\n')
+			f.close()
 		return 0
 
 	def get_words(self, inrange=lambda i:True):
 		if not self.result:
 			self.run()
-		return [ w.strip() for i,w in enumerate(self.result)
+		return [ w for i,w in enumerate(self.result)
 			 if inrange(i) ]
 
 	def get_known_words(self, inrange=lambda i:True):
 		if not self.result:
 			self.run()
-		return [ w.strip() for i,w in enumerate(self.result)
-			 if not '*' in w
+		return [ w for i,w in enumerate(self.result)
+			 if not w.unknown
 			 and inrange(i) ]
 
 	def get_unknown_words(self, inrange=lambda i:True):
 		if not self.result:
 			self.run()
-		return [ w.strip() for i,w in enumerate(self.result)
-			 if '*' in w
+		return [ w for i,w in enumerate(self.result)
+			 if w.unknown
 			 and inrange(i) ]
 	
 	def get_top_unknown_words(self, c=20):
-		return Counter(self.get_unknown_words()).most_common(c)
+		return Counter(w.surface for w in self.get_unknown_words()).most_common(c)
 
 	def get_top_unknown_words_string(self, c=20):
 		out = StringIO()
 		for word, count in self.get_top_unknown_words(c):
-			word = word.split('/')[0][1:]
 			out.write("%d\t %s\n" % (count, word))
 		return out.getvalue()
 		
@@ -531,28 +572,29 @@ class CoverageTest(Test):
 	def to_xml(self):
 		q = Element('dictionary')
 		q.attrib["value"] = basename(dirname(self.dct))
+		dct_checksum, fn_checksum = self._file_checksum(self.dct, self.fn)
 		
 		r = SubElement(q, "revision", 
-					value=str(self._svn_revision(dirname(self.dct))),
+					value=str(self._revision(dirname(self.dct))),
 					timestamp=datetime.utcnow().isoformat(),
-					checksum=self._checksum(open(self.dct, 'rb').read()))
+					checksum=dct_checksum)
 		
 		s = SubElement(r, 'corpus')
 		s.attrib["value"] = basename(self.fn)
-		s.attrib["checksum"] = self._checksum(open(self.fn, 'rb').read())
+		s.attrib["checksum"] = fn_checksum
 		
 		SubElement(r, 'percent').text = "%.2f" % self.get_coverage()
 		SubElement(r, 'total').text = str(len(self.get_words()))
 		SubElement(r, 'known').text = str(len(self.get_known_words()))
 		SubElement(r, 'unknown').text = str(len(self.get_unknown_words()))
 		
-		wrx = re.compile(r"\^(.*)/")
 		s = SubElement(r, 'top')
 		for word, count in self.get_top_unknown_words():
-			SubElement(s, 'word', count=str(count)).text = wrx.search(word).group(1)
+			SubElement(s, 'word', count=str(count)).text = word
 		
 		s = SubElement(r, 'system')
 		SubElement(s, 'time').text = "%.4f" % self.timer
+		self._tool_versions(s)
 		
 		return ("coverage", etree.tostring(q))
 
@@ -576,12 +618,15 @@ class DictionaryTest(Test):
 			if tag == "rule":
 				self.rules.append(attrs.get("comment", None))
 	
-	def __init__(self, langpair=None, directory=None, corpus=None, **kwargs):
-		whereis(['apertium-transfer', 'apertium-pretransfer', 'lt-proc'])
+	ruletypes = ("SELECT", "REMOVE", "MAP", "SUBSTITUTE")
+	
+	def __init__(self, langpair=None, directory=None, corpus=None, cache=None, **kwargs):
+		self._require(['apertium-transfer', 'apertium-pretransfer', 'lt-proc'])
 		
 		self.langpair = kwargs.get("langpair") or langpair
 		self.directory = kwargs.get("directory") or directory or '.'
 		self.corpus = kwargs.get("corpus") or corpus
+		self.cache = get_cache(kwargs.get("cache", cache))
 		if None in (self.directory, self.langpair):
 			raise ValueError("langpair or directory missing.")
 		
@@ -593,20 +638,13 @@ class DictionaryTest(Test):
 		self.rules = None
 		self.entries = None
 	
-	def get_transfer_command(self, tnxcount, pair1, pair2):
-		cmd = ["lt-proc {0}/{1}.automorf.bin | apertium-pretransfer".format(self.directory, self.langpair)]
-		for i in range(1, tnxcount+1):
-			if i == 1:
-				cmd.append("""apertium-transfer {0}/apertium-{1}.{2}.t1x \
-							{0}/{2}.t1x.bin \
-							{0}/{2}.autobil.bin""".format(self.directory, pair1, pair2))
-			elif i < tnxcount:
-				cmd.append("""apertium-interchunk {0}/apertium-{1}.{2}.t{3}x \
-							{0}/{2}.t{3}x.bin""".format(self.directory, pair1, pair2, i))
-			elif i == tnxcount:
-				cmd.append("""apertium-postchunk {0}/apertium-{1}.{2}.t{3}x \
-							{0}/{2}.t{3}x.bin""".format(self.directory, pair1, pair2, i))
-		return " | ".join(cmd)
+	def get_transfer_pipeline(self, tnxcount, pair1, pair2):
+		pipeline = Pipeline(
+			["lt-proc", "{0}/{1}.automorf.bin".format(self.directory, self.langpair)],
+			["apertium-pretransfer"])
+		for cmd in transfer_stages(self.directory, pair1, pair2, tnxcount):
+			pipeline.add(cmd)
+		return pipeline
 	
 	def get_transfer_rules(self):
 		if not self.trules:
@@ -616,9 +654,8 @@ class DictionaryTest(Test):
 			self.trules = defaultdict(list)
 			
 			for i in range(tnxcount):
-				cmd = self.get_transfer_command(i, self.langpair, self.langpair) # STUB must do btoh language pairs
-				p = Popen(cmd, shell=True, close_fds=True, stdout=PIPE)
-				res = p.communicate(destxt(open(self.corpus, 'r').read()))[0].decode('utf-8').split('\n')
+				pipeline = self.get_transfer_pipeline(i, self.langpair, self.langpair) # STUB must do btoh language pairs
+				res = pipeline.run(destxt(open(self.corpus, 'r').read())).split('\n')
 				fn = "apertium-{0}.{1}.t{2}x".format(self.langpair, self.langpair, tnxcount+1)
 				self.trules[fn] = [i for i in res if i in ": Rule"]
 		return self.trules
@@ -638,23 +675,28 @@ class DictionaryTest(Test):
 			c[k] = len(set(v))
 		return sum(c.values())
 	
+	@classmethod
+	def parse_tnx(cls, f):
+		parser = make_parser()
+		handler = cls.TnXHandler()
+		parser.setContentHandler(handler)
+		parser.parse(f)
+		return handler.rules
+	
+	@classmethod
+	def parse_rlx(cls, f):
+		with open(f, 'r') as rlx:
+			return [line for line in rlx if line.strip().startswith(cls.ruletypes)]
+	
 	def get_rules(self):
 		if not self.rules:
 			self.rules = defaultdict(list)
 			
 			for i in self.tnxfiles:
-				parser = make_parser()
-				handler = self.TnXHandler()
-				parser.setContentHandler(handler)
-				parser.parse(i)
-				self.rules[basename(i)] = handler.rules
+				self.rules[basename(i)] = self.cache.get(i, 'tnx', self.parse_tnx)
 			
-			ruletypes = ("SELECT", "REMOVE", "MAP", "SUBSTITUTE")
 			for i in self.rlxfiles:
-				f = open(i, 'r')
-				for line in f:
-					if line.strip().startswith(ruletypes):
-						self.rules[basename(i)].append(line)
+				self.rules[basename(i)] += self.cache.get(i, 'rlx', self.parse_rlx)
 						
 		return self.rules
 	
@@ -672,7 +714,7 @@ class DictionaryTest(Test):
 			self.entries = defaultdict(list)
 			
 			for i in self.dixfiles:
-				self.entries[basename(i)] += DixFile(i).get_entries()
+				self.entries[basename(i)] += DixFile(i, self.cache).get_entries()
 		return self.entries
 	
 	def get_entry_counter(self):
@@ -701,7 +743,7 @@ class DictionaryTest(Test):
 		q.attrib["value"] = basename(abspath(self.directory))
 		
 		r = SubElement(q, 'revision')
-		r.attrib["value"] = str(self._svn_revision(self.directory))
+		r.attrib["value"] = str(self._revision(self.directory))
 		r.attrib["timestamp"] = datetime.utcnow().isoformat()
 		
 		SubElement(r, 'entries').text = str(self.get_entry_count())
@@ -735,49 +777,34 @@ class DictionaryTest(Test):
 
 
 class GenerationTest(Test):
-	def __init__(self, direc=None, mode=None, corpus=None, **kwargs):
+	def __init__(self, direc=None, mode=None, corpus=None, timeout=None, **kwargs):
 		self.directory = kwargs.get('direc', direc)
 		self.mode = kwargs.get('mode', mode)
 		self.corpus = kwargs.get('corpus', corpus)
+		self.timeout = kwargs.get('timeout', timeout)
 		if None in (self.directory, self.mode, self.corpus):
 			raise ValueError("direc, mode or corpus missing.")
 		
 		self.lang = '-'.join(self.mode.rsplit('-')[0:2])
-		whereis(["apertium", "lt-proc"])
+		self._require(["apertium", "lt-proc"])
 	
 	def get_transfer(self, data):
-		count = Counter()
-		out = StringIO()
-		buf = StringIO()
-		in_word = False
-		
-		for i in data:
-			if i == "^":
-				in_word = True
-			if i == "$":
-				out.write("%s$\n" % buf.getvalue())
-				count[buf.getvalue()] += 1
-				buf = StringIO()
-				in_word = False
-			if in_word:
-				buf.write(i)
-		
-		return out.getvalue().split('\n')
+		return [str(unit) for unit in scan(data)]
 					
 	def run(self):
 		timing_begin = time.time()
-		app = Popen(['apertium', '-d', self.directory, self.mode], stdin=open(self.corpus), stdout=PIPE, close_fds=True)
-		raw = app.communicate()[0].decode('utf-8')
-		transfer = self.get_transfer(raw)
-		del raw
+		f = open(self.corpus, 'r')
+		session = get_session('apertium', ['-d', self.directory], self.mode)
+		transfer = self.get_transfer(session.stream(read_chunks(f), self.timeout))
+		f.close()
 		
 		stripped = StringIO()
 		for word, count in Counter(transfer).most_common():
 			stripped.write("{:>6} {:<}\n".format(count, word))
 		stripped = stripped.getvalue()
 		
-		app = Popen(['lt-proc', '-d', "%s.autogen.bin" % pjoin(self.directory, self.lang)], stdin=PIPE, stdout=PIPE, close_fds=True)
-		surface = app.communicate(stripped.encode('utf-8'))[0].decode('utf-8')
+		generator = get_session('lt-proc', ['-d'], "%s.autogen.bin" % pjoin(self.directory, self.lang))
+		surface = generator.translate(stripped, self.timeout)
 		nofreq = re.sub(r'[\s\t]*\d*\s*\^', '^', stripped)
 		
 		gen_errors = StringIO()
@@ -808,12 +835,12 @@ class GenerationTest(Test):
 		q.attrib["value"] = basename(abspath(self.directory))
 		
 		r = SubElement(q, "revision", 
-					value=str(self._svn_revision(basename(abspath(self.directory)))),
+					value=str(self._revision(self.directory)),
 					timestamp=datetime.utcnow().isoformat())
 		
 		s = SubElement(r, 'corpus')
 		s.attrib["value"] = basename(self.corpus)
-		s.attrib["checksum"] = self._checksum(open(self.corpus, 'rb').read())
+		s.attrib["checksum"] = self._file_checksum(self.corpus)
 		
 		SubElement(r, "total").text = str(len(self.multiform) + len(self.multibidix) + len(self.tagmismatch))
 		SubElement(r, "multiform").text = str(len(self.multiform))
@@ -822,6 +849,7 @@ class GenerationTest(Test):
 		
 		s = SubElement(r, "system")
 		SubElement(s, "speed").text = "%.4f" % self.timer
+		self._tool_versions(s)
 		
 		return ("generation", etree.tostring(q))
 		
@@ -904,9 +932,10 @@ class MorphTest(Test):
 			else:
 				self.write(colourise("[PASS] %s\n" % out))
 			
-	def __init__(self, f=None, **kwargs):
+	def __init__(self, f=None, timeout=None, **kwargs):
 		self.args = dict(kwargs)
 		self.f = self.args.get('test_file', f)
+		self.timeout = timeout
 
 		self.fails = 0
 		self.passes = 0
@@ -929,7 +958,7 @@ class MorphTest(Test):
 			raise AttributeError("'%s' not found in Config of test file." % section)
 		
 		self.program = shlex.split(self.args.get('app') or f["Config"][section].get("App", "hfst-lookup"))
-		whereis([self.program[0]])
+		self._require([self.program[0]])
 
 		self.gen = self.args.get('gen') or f["Config"][section].get("Gen", None)
 		self.morph = self.args.get('morph') or f["Config"][section].get("Morph", None)
@@ -981,39 +1010,27 @@ class MorphTest(Test):
 
 	def parse_fsts(self, tests):
 		invtests = invert_dict(tests)
-		manager = Manager()
-		self.results = manager.dict({"gen": {}, "morph": {}})
-
-		def parser(self, d, f, tests):
-			keys = tests.keys()
-			app = Popen(self.program + [f], stdin=PIPE, stdout=PIPE, stderr=PIPE, close_fds=True)
-			args = '\n'.join(keys) + '\n'
-			
-			res, err = app.communicate(args.encode('utf-8'))
-			res = res.decode('utf-8').split('\n\n')
-			err = err.decode('utf-8').strip()
+		self.results = {"gen": {}, "morph": {}}
 
-			if app.returncode != 0:
+		# Both lookups run at once, each killed after timeout seconds
+		jobs = [i for i in (("gen", self.gen, tests), ("morph", self.morph, invtests)) if i[1]]
+		if self.args.get('verbose'):
+			for d, f, t in jobs:
+				self.out.write("Generating...\n" if d == "gen" else "Morphing...\n")
+		
+		results = process_many([dict(command=self.program + [f], data='\n'.join(t.keys()) + '\n',
+				timeout=self.timeout) for d, f, t in jobs])
+		for (d, f, t), res in zip(jobs, results):
+			if isinstance(res, ProcessTimeout):
+				self.results['err'] = str(res)
+			elif isinstance(res, ProcessError):
 				self.results['err'] = "\n".join(
-					[i for i in [res[0], err, "(Error code: %s)" % app.returncode] if i != '']
+					[i for i in [res.stderr.strip(), "(Error code: %s)" % res.returncode] if i != '']
 				)
+			elif isinstance(res, BaseException):
+				raise res
 			else:
-				self.results[d] = self.parse_fst_output(res)
-		
-		gen = Process(target=parser, args=(self, "gen", self.gen, tests))
-		gen.daemon = True
-		gen.start()
-		if self.args.get('verbose'):
-			self.out.write("Generating...\n")
-		
-		morph = Process(target=parser, args=(self, "morph", self.morph, invtests))
-		morph.daemon = True
-		morph.start()
-		if self.args.get('verbose'):
-			self.out.write("Morphing...\n")
-
-		gen.join()
-		morph.join()
+				self.results[d] = self.parse_fst_output(res[0].split('\n\n'))
 
 		if self.args.get('verbose'):
 			self.out.write("Done!\n")
@@ -1101,18 +1118,19 @@ class MorphTest(Test):
 	def to_xml(self):
 		q = Element('config')
 		q.attrib["value"] = self.f
+		f_checksum, gen_checksum, morph_checksum = self._file_checksum(self.f, self.gen, self.morph)
 		
-		r = SubElement(q, "revision", value=str(self._svn_revision(dirname(self.f))),
+		r = SubElement(q, "revision", value=str(self._revision(dirname(self.f))),
 					timestamp=datetime.utcnow().isoformat(),
-					checksum=self._checksum(open(self.f, 'rb').read()))
+					checksum=f_checksum)
 		
 		s = SubElement(r, 'gen')
 		s.attrib["value"] = self.gen
-		s.attrib["checksum"] = self._checksum(open(self.gen, 'rb').read())
+		s.attrib["checksum"] = gen_checksum
 		
 		s = SubElement(r, 'morph')
 		s.attrib["value"] = self.morph
-		s.attrib["checksum"] = self._checksum(open(self.morph, 'rb').read())
+		s.attrib["checksum"] = morph_checksum
 		
 		SubElement(r, 'total').text = str(self.passes + self.fails)
 		SubElement(r, 'passes').text = str(self.passes)
@@ -1127,6 +1145,7 @@ class MorphTest(Test):
 		
 		s = SubElement(r, "system")
 		SubElement(s, "speed").text = "%.4f" % self.timer
+		self._tool_versions(s)
 		
 		return ("morph", etree.tostring(r))
 
@@ -1139,14 +1158,15 @@ class RegressionTest(Test):
 	ns = "{http://www.mediawiki.org/xml/export-0.3/}"
 	program = "apertium"
 	
-	def __init__(self, url=None, mode=None, directory=".", **kwargs):
+	def __init__(self, url=None, mode=None, directory=".", timeout=None, **kwargs):
 		url = kwargs.get('url', url)
 		mode = kwargs.get('mode', mode)
 		directory = kwargs.get('directory', directory)
+		self.timeout = kwargs.get('timeout', timeout)
 		if None in (url, mode):
 			raise ValueError("Url or mode parameter missing.")
 
-		whereis([self.program])
+		self._require([self.program])
 		self.mode = mode
 		self.url = url
 		self.directory = directory
@@ -1194,13 +1214,8 @@ class RegressionTest(Test):
 			self.out.write("Now testing: %s\n" % side)
 			
 			args = '\n'.join(self.tests[side].keys())
-			app = Popen([self.program, '-d', self.directory, self.mode], stdin=PIPE, stdout=PIPE, stderr=PIPE, close_fds=True)
-			app.stdin.write(args.encode('utf-8'))
-			res = app.communicate()[0]
-			
-			self.results = str(res.decode('utf-8')).split('\n')
-			if app.returncode > 0:
-				return app.returncode
+			res = get_session(self.program, ['-d', self.directory], self.mode).translate(args, self.timeout)
+			self.results = res.split('\n')
 
 			for n, test in enumerate(self.tests[side].items()):
 				if n >= len(self.results):
@@ -1251,7 +1266,7 @@ class RegressionTest(Test):
 		q.attrib['revision'] = page.find(ns + 'revision').find(ns + 'id').text
 		
 		r = SubElement(q, 'revision', 
-					value=str(self._svn_revision(self.directory)),
+					value=str(self._revision(self.directory)),
 					timestamp=datetime.utcnow().isoformat())
 		
 		SubElement(r, 'percent').text = "%.2f" % self.get_total_percent()
@@ -1261,6 +1276,7 @@ class RegressionTest(Test):
 		
 		s = SubElement(r, "system")
 		SubElement(s, "speed").text = "%.4f" % self.timer
+		self._tool_versions(s)
 		
 		return ("regression", etree.tostring(q))
 
@@ -1270,8 +1286,8 @@ class RegressionTest(Test):
 
 class VocabularyTest(Test):
 	def __init__(self, direction, lang1, lang2, output, 
-				fdir=".", ana=None, gen=None):
-		whereis(['apertium-transfer', 'apertium-pretransfer', 'lt-expand'])
+				fdir=".", ana=None, gen=None, timeout=None):
+		self._require(['apertium-transfer', 'apertium-pretransfer', 'lt-expand'])
 		dictlang = langpair = "%s-%s" % (lang1, lang2)
 		if direction.lower() == "rl":
 			langpair = "%s-%s" % (lang2, lang1)
@@ -1280,72 +1296,68 @@ class VocabularyTest(Test):
 		if tnxcount == 0:
 			raise ValueError("No tnx files found. Try compiling your dictionary or something.")
 		
-		cmd = ["apertium-pretransfer"]
-		for i in range(1, tnxcount+1):
-			if i == 1:
-				cmd.append("""apertium-transfer {0}/apertium-{1}.{2}.t1x \
-							{0}/{2}.t1x.bin \
-							{0}/{2}.autobil.bin""".format(fdir, dictlang, langpair))
-			elif i < tnxcount:
-				cmd.append("""apertium-interchunk {0}/apertium-{1}.{2}.t{3}x \
-							{0}/{2}.t{3}x.bin""".format(fdir, dictlang, langpair, i))
-			elif i == tnxcount:
-				cmd.append("""apertium-postchunk {0}/apertium-{1}.{2}.t{3}x \
-							{0}/{2}.t{3}x.bin""".format(fdir, dictlang, langpair, i))
-		self.transfer_cmd = " | ".join(cmd)
+		self.transfer_stages = [["apertium-pretransfer"]] + \
+				transfer_stages(fdir, dictlang, langpair, tnxcount)
 		
 		self.lang1 = lang1
 		self.lang2 = lang2
 		self.output = output
 		
-		self.tmp = []
-		for i in range(3):
-			self.tmp.append(NamedTemporaryFile(delete=False))
-			self.tmp[i].close()
-		
 		self.fdir = fdir
+		self.timeout = timeout
 		self.anadix = ana or pjoin(fdir, "apertium-{0}.{1}.dix".format(dictlang, langpair.split('-')[0]))
 		self.genbin = gen or pjoin(fdir, "{0}.autogen.bin".format(langpair))
 		
 		self.out = None
 		self.alphabet = None
 		self.counter = None
+		self.pipeline = None
+	
+	def expansions(self, chunks):
+		"""Filters lt-expand's output, chunks of bytes, down to the lexical
+		forms the analyser accepts, as transfer input lines."""
+		alph = "".join(re.escape(c) for c in self.alphabet)
+		pattern = re.compile("[{0}]:(>:)?[{0}]".format(alph))
+		fields = re.compile(":>:|:")
+		
+		rest = b""
+		for chunk in itertools.chain(chunks, [b"\n"]):
+			lines = (rest + chunk).split(b"\n")
+			rest = lines.pop()
+			out = []
+			for line in lines:
+				line = line.decode('utf-8')
+				if pattern.search(line):
+					lexical = fields.split(line)[1].replace("/", "\\/")
+					out.append("^%s$ ^.<sent>$\n" % lexical)
+			yield "".join(out).encode('utf-8')
 		
 	def run(self):
 		self.out = open(self.output, 'w')
 		self.alphabet = DixFile(self.anadix).get_alphabet()
-		#TODO: pythonise the awk command
-		cmd = r"""lt-expand {dix} | awk -vPATTERN="[{alph}]:(>:)?[{alph}]" -F':|:>:' '$0 ~ PATTERN {{ gsub("/","\\/",$2); print "^" $2 "$ ^.<sent>$"; }}' | tee {f0} | {transfer} | tee {f1} | lt-proc -d {bin} > {f2}""".format(
-			dix=self.anadix,
-			bin=self.genbin,
-			transfer=self.transfer_cmd,
-			alph=self.alphabet,
-			f0=self.tmp[0].name,
-			f1=self.tmp[1].name,
-			f2=self.tmp[2].name
-		)
-
-		for i in range(3):
-			self.tmp[i] = open(self.tmp[i].name, 'r')
 		
 		timing_begin = time.time()
-		p = Popen(cmd, shell=True, stdout=PIPE, stderr=PIPE, close_fds=True)
-		res, err = p.communicate()
+		source = []
+		transfer = []
+		self.pipeline = Pipeline()
+		self.pipeline.add(["lt-expand", self.anadix], tap=source.append, transform=self.expansions)
+		for cmd in self.transfer_stages:
+			self.pipeline.add(cmd)
+		self.pipeline.stages[-1].tap = transfer.append
+		self.pipeline.add(["lt-proc", "-d", self.genbin])
+		generated = self.pipeline.run(timeout=self.timeout)
 		self.timer = time.time() - timing_begin
 		
+		source = b"".join(source).decode('utf-8').split('\n')[:-1] # every line ends in \n
+		transfer = b"".join(transfer).decode('utf-8').split('\n')
 		arrow_output = "{:<24} {A} {:<24} {A} {:<24}\n"
 		regex = re.compile(r"(\^.<sent>\$|\\| \.$)")
-		for a, b, c in zip(self.tmp[0], self.tmp[1], self.tmp[2]):
+		for a, b, c in zip(source, transfer, generated.split('\n')):
 			a = regex.sub("", a).strip()
 			b = regex.sub("", b).strip()
 			c = regex.sub("", c).strip()
 			self.out.write(arrow_output.format(a, b, c, A=ARROW))
 		
-		# TODO: allow saving this
-		for i in self.tmp:
-			i.close()
-			os.unlink(i.name)
-		
 		self.out.close()
 		self.get_symbol_count()
 		
@@ -1364,7 +1376,7 @@ class VocabularyTest(Test):
 		q.attrib["value"] = basename(abspath(self.fdir))
 		
 		r = SubElement(q, "revision", 
-					value=str(self._svn_revision(basename(abspath(self.fdir)))),
+					value=str(self._revision(self.fdir)),
 					timestamp=datetime.utcnow().isoformat())
 		
 		SubElement(r, "lines").text = str(self.counter['lines'])
@@ -1373,6 +1385,7 @@ class VocabularyTest(Test):
 		
 		s = SubElement(r, "system")
 		SubElement(s, "speed").text = "%.4f" % self.timer
+		self._tool_versions(s)
 		
 		return ("vocabulary", etree.tostring(q))
 
@@ -1381,11 +1394,32 @@ class VocabularyTest(Test):
 		x += "# count: %s\n" % self.counter['#']
 		x += "@ count: %s\n\n" % self.counter['@']
 		x += "Time: %.4f seconds\n" % self.timer
+		if self.pipeline:
+			x += "\n%s\n\n" % self.pipeline.report()
 		return "%sData output to %s." % (x, self.output)
 
 
 # SUPPORT FUNCTIONS
 
+def transfer_stages(fdir, dictlang, langpair, tnxcount):
+	"""Commands for the transfer stages of a pair with tnxcount .tNx files"""
+	cmd = []
+	for i in range(1, tnxcount+1):
+		if i == 1:
+			cmd.append(["apertium-transfer",
+						"{0}/apertium-{1}.{2}.t1x".format(fdir, dictlang, langpair),
+						"{0}/{1}.t1x.bin".format(fdir, langpair),
+						"{0}/{1}.autobil.bin".format(fdir, langpair)])
+		elif i < tnxcount:
+			cmd.append(["apertium-interchunk",
+						"{0}/apertium-{1}.{2}.t{3}x".format(fdir, dictlang, langpair, i),
+						"{0}/{1}.t{2}x.bin".format(fdir, langpair, i)])
+		elif i == tnxcount:
+			cmd.append(["apertium-postchunk",
+						"{0}/apertium-{1}.{2}.t{3}x".format(fdir, dictlang, langpair, i),
+						"{0}/{1}.t{2}x.bin".format(fdir, langpair, i)])
+	return cmd
+
 def string_to_list(data):
 	if isinstance(data, bytes): return [data.decode('utf-8')]
 	elif isinstance(data, str): return [data]
@@ -0,0 +1,174 @@
+from subprocess import Popen, PIPE
+from collections import deque
+from codecs import getincrementaldecoder
+from threading import Thread, Lock
+import atexit
+import select
+import time
+import os
+
+from apertium.engine import ProcessError, ProcessTimeout
+
+
+class Session(object):
+	"""A transducer process kept alive in null-flush mode.
+
+	Every call to translate() writes one block of input terminated by a NUL
+	byte and reads the output up to the NUL the program writes back, so the
+	binary is only loaded once for the whole lifetime of the session.
+	timeout is the seconds allowed per block (None waits forever), unless
+	a call gives its own.
+	"""
+	flush_arg = "-z"
+	bufsize = 65536
+
+	def __init__(self, command, timeout=None):
+		self.command = list(command)
+		self.timeout = timeout
+		self.proc = None
+		self.lock = Lock()
+		self.err = deque(maxlen=50)
+		self.error = None
+
+	def __enter__(self):
+		return self.start()
+
+	def __exit__(self, *args):
+		self.close()
+
+	def alive(self):
+		return self.proc is not None and self.proc.poll() is None
+
+	def start(self):
+		if not self.alive():
+			self.proc = Popen(self.command, stdin=PIPE, stdout=PIPE,
+					stderr=PIPE, close_fds=True)
+			self.err.clear()
+			t = Thread(target=self._drain, args=(self.proc.stderr,))
+			t.daemon = True
+			t.start()
+		return self
+
+	def close(self):
+		if self.proc is None:
+			return
+		try:
+			self.proc.stdin.close()
+			self.proc.wait(5)
+		except Exception:
+			self.proc.kill()
+			self.proc.wait()
+		self.proc.stdout.close()
+		self.proc = None
+
+	def _drain(self, pipe):
+		for line in pipe:
+			self.err.append(line.decode('utf-8', 'replace'))
+
+	def _feed(self, proc, chunks):
+		stdin = proc.stdin
+		try:
+			for chunk in chunks:
+				if hasattr(chunk, 'encode'):
+					chunk = chunk.encode('utf-8')
+				if b"\0" in chunk:
+					chunk = chunk.replace(b"\0", b"")
+				stdin.write(chunk)
+			stdin.write(b"\0")
+			stdin.flush()
+		except OSError:
+			pass # the reader notices the process died and reports it
+		except Exception as e:
+			# Bad input; end the process so the reader stops waiting for output
+			self.error = e
+			proc.kill()
+
+	def _read(self, timeout):
+		fd = self.proc.stdout.fileno()
+		deadline = None if timeout is None else time.time() + timeout
+		while 1:
+			if deadline is not None and not select.select([fd], [], [],
+					max(0, deadline - time.time()))[0]:
+				self.proc.kill()
+				self.close()
+				raise ProcessTimeout(" ".join(self.command), timeout, "".join(self.err))
+			chunk = os.read(fd, self.bufsize)
+			if not chunk:
+				returncode = self.proc.wait()
+				self.proc.stdout.close()
+				self.proc = None
+				if self.error is not None:
+					raise self.error
+				raise ProcessError(returncode, "".join(self.err))
+			i = chunk.find(b"\0")
+			if i >= 0:
+				yield chunk[:i]
+				return
+			yield chunk
+
+	def stream(self, chunks, timeout=None):
+		"""Sends an iterable of chunks through the process as one block and
+		yields the output as it arrives.
+
+		NUL bytes in the input are removed, as they would end the block early.
+		"""
+		if timeout is None:
+			timeout = self.timeout
+		with self.lock:
+			self.start()
+			self.error = None
+			# Feed from another thread so a full stdout pipe can't deadlock us
+			feeder = Thread(target=self._feed, args=(self.proc, chunks))
+			feeder.daemon = True
+			feeder.start()
+			decoder = getincrementaldecoder('utf-8')()
+			done = False
+			try:
+				for chunk in self._read(timeout):
+					yield decoder.decode(chunk)
+				yield decoder.decode(b"", True)
+				done = True
+			finally:
+				if not done and self.alive():
+					# Abandoned halfway through a block; the process is out
+					# of step with us now, so start afresh next time.
+					self.proc.kill()
+					self.close()
+				feeder.join()
+
+	def translate(self, data, timeout=None):
+		"""Sends one block of data through the process and returns its output."""
+		return "".join(self.stream([data], timeout))
+
+
+class SessionPool(object):
+	"""Sessions shared for the whole run, keyed by (program, args, binary)."""
+
+	def __init__(self):
+		self.sessions = {}
+		self.lock = Lock()
+
+	def get(self, program, args=(), binary=None):
+		key = (program, tuple(args), binary)
+		with self.lock:
+			session = self.sessions.get(key)
+			if session is None:
+				command = [program, Session.flush_arg] + list(args)
+				if binary is not None:
+					command.append(binary)
+				session = self.sessions[key] = Session(command)
+		return session
+
+	def close(self):
+		with self.lock:
+			for session in self.sessions.values():
+				session.close()
+			self.sessions.clear()
+
+
+pool = SessionPool()
+atexit.register(pool.close)
+
+def get_session(program, args=(), binary=None):
+	"""Returns the pooled session for the given program, args and binary."""
+	return pool.get(program, args, binary)
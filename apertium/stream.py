@@ -0,0 +1,94 @@
+"""Scanner for the Apertium stream format.
+
+Yields a LexicalUnit for every ^...$ in the input, skipping blanks and
+superblanks. Input may be a string, a file object or an iterable of string
+chunks; lexical units split across chunks are put back together.
+"""
+import re
+
+_token = re.compile(r"""
+	\\.                          # escaped character in a blank
+	| \[(?:\\.|[^\\\]])*\]       # superblank
+	| \^((?:\\.|[^\\$])*)\$      # lexical unit
+	| [\^\[\\]                   # start of a token continuing in the next chunk
+""", re.S | re.X)
+_analysis = re.compile(r"/((?:\\.|[^\\/])*)", re.S)
+_unescape = re.compile(r"\\(.)", re.S)
+
+flags = "*#@"
+
+
+class LexicalUnit(object):
+	"""A single lexical unit.
+
+	raw is the escaped text between ^ and $, surface the unescaped surface
+	form, analyses the (still escaped) readings after it and flag the mark
+	on the first reading (or on the surface form when there are none):
+	'*' for unknown words, '#' and '@' for generation and transfer errors,
+	or '' when there is no mark.
+	"""
+	__slots__ = ('raw', 'surface', 'analyses', 'flag')
+
+	def __init__(self, raw):
+		self.raw = raw
+		if '\\' in raw:
+			parts = _analysis.findall('/' + raw)
+			self.surface = _unescape.sub(r"\1", parts[0])
+		else:
+			parts = raw.split('/')
+			self.surface = parts[0]
+		self.analyses = tuple(parts[1:])
+
+		first = self.analyses[0] if self.analyses else raw
+		self.flag = first[:1] if first[:1] in flags else ''
+
+	@property
+	def unknown(self):
+		return self.flag == '*'
+
+	def __str__(self):
+		return "^%s$" % self.raw
+
+	def __repr__(self):
+		return "LexicalUnit(%r)" % self.raw
+
+	def __eq__(self, other):
+		return isinstance(other, LexicalUnit) and self.raw == other.raw
+
+	def __hash__(self):
+		return hash(self.raw)
+
+
+def _chunks(data, size=65536):
+	if isinstance(data, str):
+		return (data,)
+	if hasattr(data, 'read'):
+		return iter(lambda: data.read(size), '')
+	return data
+
+def scan(data):
+	"""Yields a LexicalUnit for each lexical unit in data."""
+	pending = ""
+
+	def tokens(buf):
+		nonlocal pending
+		for m in _token.finditer(buf):
+			raw = m.group(1)
+			if raw is not None:
+				yield LexicalUnit(raw)
+			elif m.end() - m.start() == 1:
+				# Unterminated token; wait for more input
+				pending = buf[m.start():]
+				return
+
+	for chunk in _chunks(data):
+		buf, pending = pending + chunk, ""
+		for unit in tokens(buf):
+			yield unit
+
+	# At the end of the input an unterminated token is just a stray
+	# character, so carry on scanning after it.
+	while pending:
+		buf, pending = pending[1:], ""
+		for unit in tokens(buf):
+			yield unit
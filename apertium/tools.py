@@ -0,0 +1,192 @@
+"""Registry of the Apertium and HFST tools found on $PATH.
+
+Every tool is resolved once per process (the first match in $PATH order,
+like a shell) and its version probed with --version. The results are kept
+on disk under a fingerprint of $PATH and the mtimes of its directories, so
+a later run with the same $PATH, where no tools have been installed or
+removed, needs neither the search nor the probes.
+"""
+from concurrent.futures import ThreadPoolExecutor
+from subprocess import Popen, PIPE, DEVNULL, TimeoutExpired
+from threading import Lock
+from hashlib import sha1
+from tempfile import NamedTemporaryFile
+import json
+import os
+import os.path
+import re
+
+pjoin = os.path.join
+
+
+class ToolRegistry(object):
+	"""Paths and versions of external tools.
+
+	directory is where the registry is kept between runs; None disables
+	the on-disk cache. timeout is how long a version probe may take.
+	"""
+	version_re = re.compile(r"\d+\.\d+")
+
+	def __init__(self, directory=None, timeout=5):
+		self.directory = directory
+		self.timeout = timeout
+		self.lock = Lock()
+		self.fp = None
+		self.tools = {}
+
+	def fingerprint(self):
+		"""Hash of $PATH and the mtime of each of its directories."""
+		h = sha1()
+		for d in os.environ.get('PATH', '').split(os.pathsep):
+			try:
+				mtime = os.stat(d or '.').st_mtime_ns
+			except OSError:
+				mtime = -1
+			h.update(("%s\0%s\0" % (d, mtime)).encode('utf-8', 'surrogateescape'))
+		return h.hexdigest()
+
+	def _file(self):
+		return pjoin(self.directory, 'tools.json')
+
+	def _load(self):
+		"""Makes self.tools match the current $PATH, from disk if possible."""
+		fp = self.fingerprint()
+		if fp == self.fp:
+			return
+		self.fp = fp
+		self.tools = {}
+		if self.directory is None:
+			return
+		try:
+			with open(self._file(), 'r') as f:
+				data = json.load(f)
+			if data.get('fingerprint') == fp:
+				self.tools = data['tools']
+		except (OSError, ValueError, KeyError, TypeError):
+			pass
+
+	def _save(self):
+		if self.directory is None:
+			return
+		try:
+			os.makedirs(self.directory, exist_ok=True)
+			tmp = NamedTemporaryFile('w', dir=self.directory, delete=False)
+			with tmp:
+				json.dump({'fingerprint': self.fp, 'tools': self.tools}, tmp)
+			os.replace(tmp.name, self._file())
+		except OSError:
+			pass
+
+	def _search(self, name):
+		if os.sep in name:
+			candidates = [name]
+		else:
+			candidates = [pjoin(d or '.', name) for d in os.environ.get('PATH', '').split(os.pathsep)]
+		for path in candidates:
+			if os.path.isfile(path) and os.access(path, os.X_OK):
+				return os.path.abspath(path)
+		return None
+
+	def probe(self, path):
+		"""Returns the first line of `path --version` that looks like a
+		version, or None."""
+		try:
+			proc = Popen([path, '--version'], stdin=DEVNULL, stdout=PIPE,
+					stderr=PIPE, close_fds=True)
+		except OSError:
+			return None
+		try:
+			out, err = proc.communicate(timeout=self.timeout)
+		except TimeoutExpired:
+			proc.kill()
+			proc.communicate()
+			return None
+		for line in (out + b"\n" + err).decode('utf-8', 'replace').splitlines():
+			if self.version_re.search(line):
+				return line.strip()[:200]
+		return None
+
+	def _resolve(self, name):
+		"""Returns the entry for name, finding and probing it if needed."""
+		entry = self.tools.get(name)
+		if entry is not None:
+			try:
+				if os.stat(entry['path']).st_mtime_ns == entry['mtime']:
+					return entry
+			except OSError:
+				pass
+
+		path = self._search(name)
+		if path is None:
+			return None
+		entry = {'path': path, 'mtime': os.stat(path).st_mtime_ns,
+				'version': self.probe(path)}
+		with self.lock:
+			self.tools[name] = entry
+		return entry
+
+	def require(self, programs):
+		"""Returns {program: path} for programs, raising EnvironmentError
+		for the first one that can't be found."""
+		programs = list(programs)
+		with self.lock:
+			self._load()
+			before = dict((p, self.tools.get(p)) for p in programs)
+
+		if len(programs) < 2:
+			entries = [self._resolve(p) for p in programs]
+		else:
+			with ThreadPoolExecutor(len(programs)) as pool:
+				entries = list(pool.map(self._resolve, programs))
+
+		with self.lock:
+			if any(before[p] is not e for p, e in zip(programs, entries)):
+				self._save()
+
+		out = {}
+		for p, entry in zip(programs, entries):
+			if entry is None:
+				raise EnvironmentError("Cannot find `%s`. Check $PATH." % p)
+			out[p] = entry['path']
+		return out
+
+	def path(self, program):
+		return self.require([program])[program]
+
+	def version(self, program):
+		"""Returns the version line of program, or None if it has none."""
+		self.require([program])
+		return self.tools[program]['version']
+
+	def versions(self):
+		"""{program: version} for every program resolved so far."""
+		with self.lock:
+			return dict((k, v['version']) for k, v in self.tools.items())
+
+	def clear(self):
+		with self.lock:
+			self.fp = None
+			self.tools = {}
+			if self.directory is not None:
+				try:
+					os.unlink(self._file())
+				except OSError:
+					pass
+
+
+_default = None
+
+def get_tools():
+	"""Returns the process-wide ToolRegistry, which is kept in the cache
+	directory."""
+	global _default
+	if _default is None:
+		from apertium.cache import default_cache_dir
+		_default = ToolRegistry(default_cache_dir())
+	return _default
+
+def require(programs):
+	return get_tools().require(programs)
+
+def tool_version(program):
+	return get_tools().version(program)
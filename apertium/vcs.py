@@ -0,0 +1,97 @@
+"""Revisions of working copies, for labelling test results.
+
+The version control system (svn or git) is detected per directory and the
+revision resolved once per directory per run. An explicit revision can be
+set to override detection, e.g. for exported trees.
+"""
+from threading import Lock
+import os
+import os.path
+import re
+
+from apertium.engine import ProcessError
+
+
+class RevisionError(Exception):
+	"""The revision of a directory can't be determined."""
+	pass
+
+class UncleanWorkingDirectoryException(RevisionError):
+	pass
+
+
+class RevisionProvider(object):
+	git_svn_id = re.compile(r"^git-svn-id: \S+@(\d+) ", re.M)
+
+	def __init__(self, override=None):
+		self.override = override
+		self.cache = {}
+		self.lock = Lock()
+
+	def detect(self, directory):
+		"""Returns ('svn'|'git', root) for the working copy holding
+		directory, or (None, None)."""
+		d = os.path.abspath(directory or '.')
+		while 1:
+			if os.path.isdir(os.path.join(d, '.svn')):
+				return 'svn', d
+			if os.path.exists(os.path.join(d, '.git')):
+				return 'git', d
+			parent = os.path.dirname(d)
+			if parent == d:
+				return None, None
+			d = parent
+
+	def revision(self, directory):
+		if self.override is not None:
+			return str(self.override)
+
+		key = os.path.abspath(directory or '.')
+		with self.lock:
+			if key in self.cache:
+				return self.cache[key]
+
+		vcs, root = self.detect(key)
+		if vcs is None:
+			raise RevisionError("%s is not under version control. Give the revision explicitly." % key)
+		rev = getattr(self, '_' + vcs)(key)
+
+		with self.lock:
+			self.cache[key] = rev
+		return rev
+
+	def _run(self, command):
+		# imported here as apertium imports this module
+		from apertium import process
+		try:
+			return process(command)[0].strip()
+		except (OSError, ProcessError) as e:
+			raise RevisionError("`%s` failed: %s" % (" ".join(command), e))
+
+	def _svn(self, directory):
+		res = self._run(['svnversion', directory])
+		if not res.isdigit():
+			raise UncleanWorkingDirectoryException("You must have a clean SVN directory. Commit or remove uncommitted files.")
+		return res
+
+	def _git(self, directory):
+		git = ['git', '-C', directory]
+		if self._run(git + ['status', '--porcelain', '--untracked-files=no']):
+			raise UncleanWorkingDirectoryException("You must have a clean git directory. Commit or stash your changes.")
+
+		# Mirrors of SVN repositories keep the SVN revision in the message
+		m = self.git_svn_id.search(self._run(git + ['log', '-1', '--format=%B']))
+		if m:
+			return m.group(1)
+		return self._run(git + ['rev-list', '--count', 'HEAD'])
+
+
+revisions = RevisionProvider()
+
+def get_revision(directory):
+	"""Returns the revision of directory as a string."""
+	return revisions.revision(directory)
+
+def set_revision(revision):
+	"""Uses revision for every directory instead of asking the VCS."""
+	revisions.override = revision
@@ -14,7 +14,9 @@ setup(
 	name = "apertium-quality",
 	version = "0.3",
 	packages = find_packages(),
+	package_data = {'apertium.quality': ['static/*']},
 	install_requires = install_requires,
+	extras_require = {'columns': ['numpy']},
 	url = "https://github.com/bbqsrc/apertium-quality",
 	download_url="https://github.com/bbqsrc/apertium-quality/archives/master",
 	author = "Brendan Molloy",
@@ -45,5 +47,6 @@ setup(
 	aq-htmlgen = apertium.quality.frontend.website_generator:main
 	aq-autotest = apertium.quality.frontend.auto_tester:main
 	aq-wikicrp = apertium.quality.frontend.corpus_extractor:main
+	aq-statconv = apertium.quality.frontend.statistics_converter:main
 	"""
 )